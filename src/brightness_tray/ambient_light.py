@@ -1,13 +1,14 @@
 from __future__ import annotations
 
-import re
 import subprocess
 import threading
 
 
-_FLOAT_PATTERN = re.compile(r"[-+]?\d+(?:\.\d+)?")
 _POWERSHELL_PATH = r"C:\Windows\System32\WindowsPowerShell\v1.0\powershell.exe"
+_READ_SENTINEL = "EOF_L"
+_BELOW_NORMAL_PRIORITY_CLASS = 0x00004000
 _LIGHT_SENSOR_SCRIPT = r"""
+try { (Get-Process -Id $pid).PriorityClass = 'Idle' } catch {}
 try {
     [void][Windows.Devices.Sensors.LightSensor, Windows, ContentType=WindowsRuntime]
     $sensor = [Windows.Devices.Sensors.LightSensor]::GetDefault()
@@ -23,77 +24,347 @@ try {
     return
 }
 """
+# Written once after the host spawns: load the WinRT type and resolve the
+# sensor handle a single time, so each sample is just one method call.
+_HOST_INIT_SCRIPT = (
+    "try { "
+    "[void][Windows.Devices.Sensors.LightSensor, Windows, ContentType=WindowsRuntime]; "
+    "$global:sensor = [Windows.Devices.Sensors.LightSensor]::GetDefault() "
+    "} catch { $global:sensor = $null }"
+)
+# One-line request executed inside the persistent host for every sample.
+_HOST_POLL_SCRIPT = (
+    "try { "
+    "if ($global:sensor) { "
+    "$r = $global:sensor.GetCurrentReading(); if ($r) { '{0:F4}' -f $r.IlluminanceInLux } } "
+    "} catch {}; "
+    f"'{_READ_SENTINEL}'"
+)
+
+
+def _load_winrt_light_sensor_class():
+    """Return the WinRT LightSensor class when Python bindings are installed."""
+    try:
+        from winsdk.windows.devices.sensors import LightSensor
+    except Exception:
+        try:
+            from winrt.windows.devices.sensors import LightSensor
+        except Exception:
+            return None
+    return LightSensor
 
 
 class AmbientLightService:
+    _HOST_REPLY_TIMEOUT_SECONDS = 2.0
+    _HOST_MAX_CONSECUTIVE_FAILURES = 3
+    _FAILURE_BACKOFF_CAP_SECONDS = 60.0
+    _STABLE_BACKOFF_CAP_SECONDS = 10.0
+    _STABLE_SAMPLES_BEFORE_BACKOFF = 5
+    _STABLE_LUX_DELTA = 1.0
+
     def __init__(self, poll_interval_seconds: float = 2.2) -> None:
         self.poll_interval_seconds = max(1.0, float(poll_interval_seconds))
 
         self._thread: threading.Thread | None = None
         self._stop_event = threading.Event()
-        self._lock = threading.Lock()
-        self._latest_lux: float | None = None
-        self._last_error: str | None = None
+        # Published atomically as a (lux, error) tuple; single attribute
+        # stores are atomic under the GIL, so readers never need a lock.
+        # This doubles as the lock-free producer/consumer mailbox between
+        # the worker thread (or WinRT event callback) and the UI timer: the
+        # producer overwrites, the consumer always sees the latest value.
+        self._state: tuple[float | None, str | None] = (None, None)
+        self._ps_proc: subprocess.Popen | None = None
+        # Consecutive host spawn/reply failures; past the limit we stop
+        # respawning the host and stay on the one-shot path for good.
+        self._host_failures = 0
+        self._winrt_sensor = None
+        self._winrt_resolved = False
+        self._reading_changed_token = None
 
     def start(self) -> None:
+        if self._register_reading_changed():
+            return
+        if self._resolve_winrt_sensor() is not None:
+            # In-process reads complete in microseconds, so the owner's Qt
+            # timer can call probe_sensor() directly; no thread needed.
+            return
         if self._thread is not None and self._thread.is_alive():
             return
         self._stop_event.clear()
         self._thread = threading.Thread(target=self._poll_loop, daemon=True)
         self._thread.start()
 
+    def needs_external_polling(self) -> bool:
+        """True when the service relies on the caller's timer for sampling."""
+        return (
+            self._reading_changed_token is None
+            and self._resolve_winrt_sensor() is not None
+        )
+
     def stop(self) -> None:
+        self._unregister_reading_changed()
         self._stop_event.set()
         if self._thread is not None:
             self._thread.join(timeout=0.8)
         self._thread = None
+        self._close_host()
+
+    def _register_reading_changed(self) -> bool:
+        """Subscribe to sensor change events so the OS wakes us instead of polling."""
+        if self._reading_changed_token is not None:
+            return True
+        sensor = self._resolve_winrt_sensor()
+        if sensor is None:
+            return False
+        try:
+            interval_ms = max(
+                int(sensor.minimum_report_interval),
+                int(self.poll_interval_seconds * 1000),
+            )
+            sensor.report_interval = interval_ms
+            self._reading_changed_token = sensor.add_reading_changed(self._on_reading_changed)
+        except Exception:
+            self._reading_changed_token = None
+            return False
+        return True
+
+    def _unregister_reading_changed(self) -> None:
+        token = self._reading_changed_token
+        self._reading_changed_token = None
+        if token is None or self._winrt_sensor is None:
+            return
+        try:
+            self._winrt_sensor.remove_reading_changed(token)
+        except Exception:
+            pass
+
+    def _on_reading_changed(self, _sender, args) -> None:
+        try:
+            lux = float(args.reading.illuminance_in_lux)
+        except Exception:
+            return
+        if lux < 0:
+            lux = 0.0
+        self._state = (lux, None)
 
     def probe_sensor(self) -> float | None:
         lux = self._query_lux()
-        with self._lock:
-            if lux is not None:
-                self._latest_lux = lux
-                self._last_error = None
-            else:
-                self._last_error = "Ambient light sensor reading unavailable."
+        if lux is not None:
+            self._state = (lux, None)
+        else:
+            self._state = (
+                self._state[0],
+                "Ambient light sensor reading unavailable.",
+            )
         return lux
 
     def latest_lux(self) -> float | None:
-        with self._lock:
-            return self._latest_lux
+        return self._state[0]
 
     def last_error(self) -> str | None:
-        with self._lock:
-            return self._last_error
+        return self._state[1]
 
     def _poll_loop(self) -> None:
+        current_interval = self.poll_interval_seconds
+        last_lux_value: float | None = None
+        stable_samples = 0
+
         while not self._stop_event.is_set():
             lux = self._query_lux()
-            with self._lock:
-                if lux is not None:
-                    self._latest_lux = lux
-                    self._last_error = None
-                elif self._latest_lux is None:
-                    self._last_error = "Ambient light sensor reading unavailable."
-
-            if self._stop_event.wait(self.poll_interval_seconds):
+            if lux is not None:
+                self._state = (lux, None)
+            elif self._state[0] is None:
+                self._state = (None, "Ambient light sensor reading unavailable.")
+
+            if lux is None:
+                # No sensor or a wedged host: back off so we stop burning
+                # process spawns on hardware that will never answer.
+                stable_samples = 0
+                current_interval = min(
+                    self._FAILURE_BACKOFF_CAP_SECONDS, current_interval * 2.0
+                )
+            elif (
+                last_lux_value is not None
+                and abs(lux - last_lux_value) < self._STABLE_LUX_DELTA
+            ):
+                stable_samples += 1
+                if stable_samples >= self._STABLE_SAMPLES_BEFORE_BACKOFF:
+                    current_interval = min(
+                        self._STABLE_BACKOFF_CAP_SECONDS, current_interval * 2.0
+                    )
+            else:
+                stable_samples = 0
+                current_interval = self.poll_interval_seconds
+            if lux is not None:
+                last_lux_value = lux
+
+            if self._stop_event.wait(current_interval):
                 break
 
     @staticmethod
-    def _query_lux() -> float | None:
+    def _subprocess_presentation_kwargs() -> dict:
+        # Windows-only: hide the console, suppress the busy cursor, detach
+        # the child from our console group, and start it below normal
+        # priority so a sensor probe never preempts the UI thread.
         startupinfo = None
         creationflags = 0
         if hasattr(subprocess, "STARTUPINFO") and hasattr(subprocess, "STARTF_USESHOWWINDOW"):
             startupinfo = subprocess.STARTUPINFO()
             startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
+            startupinfo.dwFlags |= getattr(subprocess, "STARTF_FORCEOFFFEEDBACK", 0)
             startupinfo.wShowWindow = 0
-        creationflags = getattr(subprocess, "CREATE_NO_WINDOW", 0)
+            creationflags = (
+                getattr(subprocess, "CREATE_NO_WINDOW", 0)
+                | getattr(subprocess, "CREATE_NEW_PROCESS_GROUP", 0)
+                | _BELOW_NORMAL_PRIORITY_CLASS
+            )
+        return {"startupinfo": startupinfo, "creationflags": creationflags}
+
+    def _ensure_host(self) -> subprocess.Popen | None:
+        proc = self._ps_proc
+        if proc is not None and proc.poll() is None:
+            return proc
+        if self._host_failures >= self._HOST_MAX_CONSECUTIVE_FAILURES:
+            return None
+        self._close_host()
 
+        try:
+            proc = subprocess.Popen(
+                [
+                    _POWERSHELL_PATH,
+                    "-NoProfile",
+                    "-NonInteractive",
+                    "-ExecutionPolicy",
+                    "Bypass",
+                    "-Command",
+                    "-",
+                ],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                bufsize=1,
+                **self._subprocess_presentation_kwargs(),
+            )
+        except Exception:
+            self._host_failures += 1
+            return None
+
+        try:
+            proc.stdin.write(_HOST_INIT_SCRIPT + "\n")
+            proc.stdin.flush()
+        except Exception:
+            try:
+                proc.terminate()
+            except Exception:
+                pass
+            self._host_failures += 1
+            return None
+
+        self._ps_proc = proc
+        return proc
+
+    def _close_host(self) -> None:
+        proc = self._ps_proc
+        self._ps_proc = None
+        if proc is None:
+            return
+        try:
+            if proc.stdin is not None:
+                proc.stdin.write("exit\n")
+                proc.stdin.flush()
+        except Exception:
+            pass
+        try:
+            proc.terminate()
+        except Exception:
+            pass
+
+    def _read_host_reply(self, proc: subprocess.Popen) -> str | None:
+        """Read stdout lines until the sentinel, with a watchdog timeout.
+
+        The reader runs on a short-lived daemon thread so a wedged host cannot
+        block the poll loop; on timeout the host is killed and respawned on the
+        next sample.
+        """
+        lines: list[str] = []
+        done = threading.Event()
+
+        def reader() -> None:
+            try:
+                while True:
+                    line = proc.stdout.readline()
+                    if not line:
+                        break
+                    stripped = line.strip()
+                    if stripped == _READ_SENTINEL:
+                        break
+                    if stripped:
+                        lines.append(stripped)
+            except Exception:
+                pass
+            done.set()
+
+        thread = threading.Thread(target=reader, daemon=True)
+        thread.start()
+        if not done.wait(self._HOST_REPLY_TIMEOUT_SECONDS):
+            self._close_host()
+            return None
+        return lines[-1] if lines else None
+
+    def _resolve_winrt_sensor(self):
+        if not self._winrt_resolved:
+            self._winrt_resolved = True
+            sensor_class = _load_winrt_light_sensor_class()
+            if sensor_class is not None:
+                try:
+                    self._winrt_sensor = sensor_class.get_default()
+                except Exception:
+                    self._winrt_sensor = None
+        return self._winrt_sensor
+
+    def _query_lux(self) -> float | None:
+        sensor = self._resolve_winrt_sensor()
+        if sensor is not None:
+            try:
+                reading = sensor.get_current_reading()
+            except Exception:
+                reading = None
+            if reading is None:
+                return None
+            lux = float(reading.illuminance_in_lux)
+            return 0.0 if lux < 0 else lux
+
+        proc = self._ensure_host()
+        if proc is None:
+            return self._query_lux_oneshot()
+
+        try:
+            proc.stdin.write(_HOST_POLL_SCRIPT + "\n")
+            proc.stdin.flush()
+        except Exception:
+            self._host_failures += 1
+            self._close_host()
+            return self._query_lux_oneshot()
+
+        output = self._read_host_reply(proc)
+        if output is None:
+            self._host_failures += 1
+            return None
+        self._host_failures = 0
+        return self._parse_lux_text(output)
+
+    @staticmethod
+    def _query_lux_oneshot() -> float | None:
         try:
             completed = subprocess.run(
                 [
                     _POWERSHELL_PATH,
+                    "-NoLogo",
+                    "-NonInteractive",
                     "-NoProfile",
+                    "-ExecutionPolicy",
+                    "Bypass",
                     "-Command",
                     _LIGHT_SENSOR_SCRIPT,
                 ],
@@ -101,25 +372,24 @@ class AmbientLightService:
                 text=True,
                 timeout=2.6,
                 check=False,
-                startupinfo=startupinfo,
-                creationflags=creationflags,
+                **AmbientLightService._subprocess_presentation_kwargs(),
             )
         except Exception:
             return None
 
         if completed.returncode != 0:
             return None
+        return AmbientLightService._parse_lux_text((completed.stdout or "").strip())
 
-        output = (completed.stdout or "").strip()
+    @staticmethod
+    def _parse_lux_text(output: str) -> float | None:
+        # The host emits one bare number per sample, so a plain float() parse
+        # suffices; the one-shot path may carry trailing noise, hence split().
         if not output:
             return None
-
-        match = _FLOAT_PATTERN.search(output)
-        if match is None:
-            return None
         try:
-            lux = float(match.group(0))
-        except (TypeError, ValueError):
+            lux = float(output.split()[0])
+        except (IndexError, ValueError):
             return None
         if lux < 0:
             return 0.0
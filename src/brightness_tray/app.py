@@ -3,7 +3,7 @@ from __future__ import annotations
 import sys
 from datetime import datetime
 
-from PySide6.QtCore import QObject, QTimer
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, QTimer, Signal
 from PySide6.QtGui import QAction, QCursor
 from PySide6.QtWidgets import (
     QApplication,
@@ -23,6 +23,25 @@ from .themes import build_stylesheet, normalize_theme_name
 from .ui import BrightnessControlWindow
 
 
+class _LocationWorkerSignals(QObject):
+    finished = Signal(object)
+
+
+class _LocationWorker(QRunnable):
+    """Runs the blocking IP-geolocation lookup off the Qt main thread."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.signals = _LocationWorkerSignals()
+
+    def run(self) -> None:
+        try:
+            coords = detect_location_from_ip()
+        except Exception:
+            coords = None
+        self.signals.finished.emit(coords)
+
+
 class TrayController(QObject):
     def __init__(self, app: QApplication):
         super().__init__()
@@ -30,6 +49,10 @@ class TrayController(QObject):
 
         self.config_store = ConfigStore()
         self.config = self.config_store.load()
+        self._rules_by_target: dict[str, list[ScheduleRule]] = {}
+        self._has_sun_rules = False
+        self._rebuild_schedule_rule_index()
+        self._current_theme: str | None = None
         self._apply_theme()
         self.brightness_service = BrightnessService()
         self.schedule_engine = SunScheduleEngine()
@@ -40,43 +63,58 @@ class TrayController(QObject):
             config=self.config,
         )
         self.window.settings_changed.connect(self._handle_settings_changed)
+        self.window.monitors_loaded.connect(self._handle_initial_monitors_loaded)
 
         self._expected_auto_targets: dict[str, int] = {}
+        self._last_evaluated_minute: tuple[int, ...] | None = None
+        self._location_inflight = False
+        self._local_tz = datetime.now().astimezone().tzinfo
+        self._local_tz_refresh_hour = datetime.now().hour
 
         self.tray_icon = QSystemTrayIcon(self)
-        self.tray_icon.setIcon(app.style().standardIcon(QStyle.StandardPixmap.SP_ComputerIcon))
+        self._tray_stock_icon = app.style().standardIcon(QStyle.StandardPixmap.SP_ComputerIcon)
+        self.tray_icon.setIcon(self._tray_stock_icon)
         self.tray_icon.setToolTip("Brightness Tray")
-        self.tray_icon.setContextMenu(self._build_menu())
+        # Populated lazily on first open so menu construction stays off the
+        # startup path.
+        self._tray_menu = QMenu()
+        self._tray_menu_built = False
+        self._tray_menu.aboutToShow.connect(self._populate_tray_menu)
+        self.tray_icon.setContextMenu(self._tray_menu)
         self.tray_icon.activated.connect(self._handle_tray_activation)
         self.tray_icon.show()
 
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(500)
+        self._save_timer.timeout.connect(self._flush_config_save)
+
         self._apply_startup_setting()
         self._resolve_location_if_needed()
-        self._update_schedule_now(force_apply=True)
+        # The window defers its first monitor poll to the event loop, so the
+        # forced startup evaluation waits for monitors_loaded instead of
+        # running here against an empty monitor_rows.
 
         self.schedule_timer = QTimer(self)
-        self.schedule_timer.setInterval(1_000)
         self.schedule_timer.timeout.connect(self._update_schedule_now)
         self._refresh_schedule_timer_interval()
-        self.schedule_timer.start()
 
-    def _build_menu(self) -> QMenu:
-        menu = QMenu()
+    def _populate_tray_menu(self) -> None:
+        if self._tray_menu_built:
+            return
+        self._tray_menu_built = True
+        menu = self._tray_menu
 
         open_action = QAction("Show Popup", self)
         open_action.triggered.connect(self._show_popup)
         menu.addAction(open_action)
 
         refresh_action = QAction("Refresh Monitors", self)
-        refresh_action.triggered.connect(
-            lambda _checked=False: self.window.refresh_monitors(apply_saved=False)
-        )
+        refresh_action.triggered.connect(self._refresh_monitors_from_menu)
         menu.addAction(refresh_action)
 
         schedule_action = QAction("Apply Schedule Now", self)
-        schedule_action.triggered.connect(
-            lambda _checked=False: self._update_schedule_now(force_apply=True)
-        )
+        schedule_action.triggered.connect(self._apply_schedule_from_menu)
         menu.addAction(schedule_action)
 
         menu.addSeparator()
@@ -84,7 +122,15 @@ class TrayController(QObject):
         quit_action = QAction("Quit", self)
         quit_action.triggered.connect(self._quit)
         menu.addAction(quit_action)
-        return menu
+
+    def _refresh_monitors_from_menu(self, _checked: bool = False) -> None:
+        self.window.refresh_monitors(apply_saved=False)
+
+    def _apply_schedule_from_menu(self, _checked: bool = False) -> None:
+        self._update_schedule_now(force_apply=True)
+
+    def _handle_initial_monitors_loaded(self) -> None:
+        self._update_schedule_now(force_apply=True)
 
     def _handle_tray_activation(self, reason: QSystemTrayIcon.ActivationReason) -> None:
         if reason not in (
@@ -104,6 +150,9 @@ class TrayController(QObject):
         self.window.show_as_popup(QCursor.pos())
 
     def _quit(self, _checked: bool = False) -> None:
+        if self._save_timer.isActive():
+            self._save_timer.stop()
+            self.config_store.save(self.config)
         self.tray_icon.hide()
         self.app.quit()
 
@@ -112,12 +161,14 @@ class TrayController(QObject):
             return
         self.config = updated_config
         self.window.config = updated_config
+        self._rebuild_schedule_rule_index()
         self._apply_theme()
         self._expected_auto_targets = {}
         self._apply_startup_setting()
         self._resolve_location_if_needed()
-        self._refresh_schedule_timer_interval()
         self._update_schedule_now(force_apply=True)
+        # Last, so re-enabling the schedule restarts the stopped timer.
+        self._refresh_schedule_timer_interval()
 
     def _apply_startup_setting(self) -> None:
         if not set_startup_enabled(self.config.startup_enabled):
@@ -126,25 +177,61 @@ class TrayController(QObject):
                 "Try running the app once as administrator."
             )
 
-    def _schedule_has_sun_rules(self) -> bool:
-        return any(rule.anchor in ("sunrise", "sunset") for rule in self.config.schedule.rules)
+    def _rebuild_schedule_rule_index(self) -> None:
+        rules_by_target: dict[str, list[ScheduleRule]] = {}
+        for rule in self.config.schedule.rules:
+            rules_by_target.setdefault(rule.target, []).append(rule)
+        self._rules_by_target = rules_by_target
+        both_rules = rules_by_target.get("both", [])
+        # Fully resolved per display index (0, 1, and 2+) so the per-tick
+        # lookup is a plain tuple index with no filtering at all.
+        self._rules_by_display_index = (
+            rules_by_target.get("display1", []) + both_rules,
+            rules_by_target.get("display2", []) + both_rules,
+            both_rules,
+        )
+        # Rules only change from the settings dialog, so the sun-event scan
+        # happens here once instead of inside every schedule evaluation.
+        self._sun_rules_by_display_index = tuple(
+            any(rule.anchor in ("sunrise", "sunset") for rule in scoped)
+            for scoped in self._rules_by_display_index
+        )
+        self._has_sun_rules = any(
+            rule.anchor in ("sunrise", "sunset") for rule in self.config.schedule.rules
+        )
+        self._needs_location = self.config.schedule.enabled and self._has_sun_rules
+        self._refresh_location_missing()
+
+    def _refresh_location_missing(self) -> None:
+        self._location_missing = (
+            self.config.schedule.latitude is None or self.config.schedule.longitude is None
+        )
 
     def _refresh_schedule_timer_interval(self) -> None:
-        if self.config.schedule.enabled:
-            interval_ms = 1_000
-        else:
-            interval_ms = 60_000
-        if self.schedule_timer.interval() != interval_ms:
-            self.schedule_timer.setInterval(interval_ms)
+        # A disabled schedule needs zero ticks: the "Schedule: off" status is
+        # idempotent, so stop the timer outright and restart it on re-enable.
+        if not self.config.schedule.enabled:
+            self.schedule_timer.stop()
+            return
+        if self.schedule_timer.interval() != 15_000:
+            self.schedule_timer.setInterval(15_000)
+        if not self.schedule_timer.isActive():
+            self.schedule_timer.start()
 
     def _resolve_location_if_needed(self) -> None:
-        if not self.config.schedule.enabled:
+        if not self._needs_location:
             return
-        if not self._schedule_has_sun_rules():
+        if self._location_inflight:
             return
 
-        coords = detect_location_from_ip()
-        if coords is None:
+        self._location_inflight = True
+        worker = _LocationWorker()
+        worker.signals.finished.connect(self._handle_location_result)
+        QThreadPool.globalInstance().start(worker)
+
+    def _handle_location_result(self, coords: object) -> None:
+        self._location_inflight = False
+        if not isinstance(coords, tuple) or len(coords) != 2:
             return
 
         latitude, longitude = coords
@@ -158,49 +245,57 @@ class TrayController(QObject):
 
         self.config.schedule.latitude = latitude
         self.config.schedule.longitude = longitude
+        self._refresh_location_missing()
+        self._schedule_config_save()
+        self._update_schedule_now(force_apply=True)
+
+    def _flush_config_save(self) -> None:
         self.config_store.save(self.config)
 
+    def _schedule_config_save(self) -> None:
+        # Restarting the single-shot timer coalesces save bursts from the
+        # settings-changed cascade into one disk write.
+        self._save_timer.start()
+
     def _rules_for_display_index(self, display_index: int) -> list[ScheduleRule]:
-        if display_index == 0:
-            allowed_targets = {"display1", "both"}
-        elif display_index == 1:
-            allowed_targets = {"display2", "both"}
-        else:
-            allowed_targets = {"both"}
-        return [rule for rule in self.config.schedule.rules if rule.target in allowed_targets]
-
-    def _calculate_schedule_targets(self) -> dict[str, int]:
+        return self._rules_by_display_index[min(display_index, 2)]
+
+    def _current_local_time(self) -> datetime:
+        # The cached tzinfo avoids an astimezone() lookup per tick; refresh it
+        # once an hour so DST transitions are picked up.
+        now = datetime.now(self._local_tz)
+        if now.hour != self._local_tz_refresh_hour:
+            self._local_tz = datetime.now().astimezone().tzinfo
+            self._local_tz_refresh_hour = now.hour
+            now = datetime.now(self._local_tz)
+        return now
+
+    def _compute_schedule_state(self) -> tuple[dict[str, int], str, bool]:
+        """Resolve per-display targets, their summary text, and any link-mode
+        conflict in a single pass over the monitor rows."""
         targets: dict[str, int] = {}
-        now = datetime.now().astimezone()
+        parts: list[str] = []
+        active_values: set[int] = set()
+        now = self._current_local_time()
         for display_index, row in enumerate(self.window.monitor_rows):
             scoped_rules = self._rules_for_display_index(display_index)
             if not scoped_rules:
                 continue
             value = self.schedule_engine.target_brightness(
-                self.config.schedule, rules=scoped_rules, now=now
+                self.config.schedule,
+                rules=scoped_rules,
+                now=now,
+                uses_sun_events=self._sun_rules_by_display_index[
+                    min(display_index, 2)
+                ],
             )
             if value is None:
                 continue
             targets[row.monitor.key] = value
-        return targets
-
-    def _format_target_summary(self, targets: dict[str, int]) -> str:
-        parts: list[str] = []
-        for display_index, row in enumerate(self.window.monitor_rows):
-            value = targets.get(row.monitor.key)
-            if value is None:
-                continue
             parts.append(f"D{display_index + 1} {value}%")
-        return ", ".join(parts)
-
-    def _has_link_mode_conflict(self, targets: dict[str, int]) -> bool:
-        active_values: list[int] = []
-        for row in self.window.monitor_rows:
-            value = targets.get(row.monitor.key)
-            if value is None:
-                continue
-            active_values.append(value)
-        return len(active_values) >= 2 and len(set(active_values)) > 1
+            active_values.add(value)
+        has_conflict = len(targets) >= 2 and len(active_values) > 1
+        return targets, ", ".join(parts), has_conflict
 
     def _update_schedule_now(self, force_apply: bool = False) -> None:
         if self.window.is_ambient_auto_enabled():
@@ -216,16 +311,26 @@ class TrayController(QObject):
             self._expected_auto_targets = {}
             return
 
-        if self._schedule_has_sun_rules() and (
-            self.config.schedule.latitude is None or self.config.schedule.longitude is None
-        ):
+        # Targets only move at minute granularity, so skip re-evaluating the
+        # schedule math when the timer fires again within the same minute.
+        local_now = datetime.now()
+        evaluation_minute = (
+            local_now.year,
+            local_now.month,
+            local_now.day,
+            local_now.hour,
+            local_now.minute,
+        )
+        if not force_apply and evaluation_minute == self._last_evaluated_minute:
+            return
+        self._last_evaluated_minute = evaluation_minute
+
+        if self._has_sun_rules and self._location_missing:
             self._resolve_location_if_needed()
 
-        targets = self._calculate_schedule_targets()
+        targets, target_text, has_conflict = self._compute_schedule_state()
         if not targets:
-            if self._schedule_has_sun_rules() and (
-                self.config.schedule.latitude is None or self.config.schedule.longitude is None
-            ):
+            if self._has_sun_rules and self._location_missing:
                 self.window.set_schedule_status(
                     "Schedule: waiting for location fix."
                 )
@@ -235,8 +340,7 @@ class TrayController(QObject):
                 )
             return
 
-        target_text = self._format_target_summary(targets)
-        if self.config.link_mode and self._has_link_mode_conflict(targets):
+        if self.config.link_mode and has_conflict:
             self.window.set_link_mode(False, persist=True, apply_link_brightness=False)
             self.config = self.window.config
 
@@ -252,7 +356,12 @@ class TrayController(QObject):
     def _apply_theme(self) -> None:
         theme_name = normalize_theme_name(self.config.theme)
         self.config.theme = theme_name
+        # setStyleSheet invalidates every widget's style cache, so skip it
+        # when the theme did not actually change.
+        if theme_name == self._current_theme:
+            return
         self.app.setStyleSheet(build_stylesheet(theme_name))
+        self._current_theme = theme_name
 
 
 def run() -> None:
@@ -1,26 +1,118 @@
 from __future__ import annotations
 
+import hashlib
+import json
 import os
 import re
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
-from dataclasses import dataclass
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
+from pathlib import Path
 from typing import Any
 
-import screen_brightness_control as sbc
-
+from .config_store import get_default_config_path
 from .models import clamp_brightness
 
 
+VCP_CACHE_FILE_NAME = "vcp_cache.json"
+
+# screen_brightness_control probes WMI/DDC at import time, which is too slow
+# to pay before the tray icon appears; import it on first use instead.
+_sbc = None
+
+
+def _get_sbc():
+    global _sbc
+    if _sbc is None:
+        import screen_brightness_control
+
+        _sbc = screen_brightness_control
+    return _sbc
+
+# Memoized _normalize_method results; the same handful of method names is
+# normalized on every call-args build and picture-control entry point.
+_NORMALIZED_METHODS: dict[str | None, str | None] = {}
+
+# dxva2 entry points resolved once at import with explicit signatures, so
+# per-call ctypes type inference and attribute walks stay out of the VCP hot
+# path. All None off Windows or when resolution fails.
+_GetVCPFeatureAndVCPFeatureReply = None
+_SetVCPFeature = None
+_GetCapabilitiesStringLength = None
+_CapabilitiesRequestAndCapabilitiesReply = None
+_DestroyPhysicalMonitor = None
+if os.name == "nt":
+    try:
+        from ctypes import POINTER, byref, create_string_buffer, windll
+        from ctypes.wintypes import BOOL, BYTE, DWORD, HANDLE, LPSTR
+
+        _dxva2 = windll.dxva2
+        _GetVCPFeatureAndVCPFeatureReply = _dxva2.GetVCPFeatureAndVCPFeatureReply
+        _GetVCPFeatureAndVCPFeatureReply.argtypes = [
+            HANDLE,
+            BYTE,
+            POINTER(DWORD),
+            POINTER(DWORD),
+            POINTER(DWORD),
+        ]
+        _GetVCPFeatureAndVCPFeatureReply.restype = BOOL
+        _SetVCPFeature = _dxva2.SetVCPFeature
+        _SetVCPFeature.argtypes = [HANDLE, BYTE, DWORD]
+        _SetVCPFeature.restype = BOOL
+        _GetCapabilitiesStringLength = _dxva2.GetCapabilitiesStringLength
+        _GetCapabilitiesStringLength.argtypes = [HANDLE, POINTER(DWORD)]
+        _GetCapabilitiesStringLength.restype = BOOL
+        _CapabilitiesRequestAndCapabilitiesReply = (
+            _dxva2.CapabilitiesRequestAndCapabilitiesReply
+        )
+        _CapabilitiesRequestAndCapabilitiesReply.argtypes = [HANDLE, LPSTR, DWORD]
+        _CapabilitiesRequestAndCapabilitiesReply.restype = BOOL
+        _DestroyPhysicalMonitor = _dxva2.DestroyPhysicalMonitor
+        _DestroyPhysicalMonitor.argtypes = [HANDLE]
+        _DestroyPhysicalMonitor.restype = BOOL
+    except Exception:
+        _GetVCPFeatureAndVCPFeatureReply = None
+        _SetVCPFeature = None
+        _GetCapabilitiesStringLength = None
+        _CapabilitiesRequestAndCapabilitiesReply = None
+        _DestroyPhysicalMonitor = None
+
+_WHITESPACE_RE = re.compile(r"\s+")
+_GENERIC_MONITOR_NAMES = frozenset(
+    {
+        "",
+        "none",
+        "display",
+        "internal display",
+        "built-in display",
+        "generic pnp monitor",
+        "generic monitor",
+    }
+)
+
+
 @dataclass
 class MonitorHandle:
     key: str
     name: str
     display_index: int
     method_name: str | None
+    edid_hash: str | None = None
+    # None until probed; False marks displays whose DDC/CI never answers so
+    # picture-control probing can skip them outright.
+    is_ddc: bool | None = None
+    # Lazily built sbc call-kwargs tuple; cached here because the slider
+    # drag path rebuilds it on every get/set otherwise.
+    _call_args: tuple[dict[str, Any], ...] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class PictureControl:
     code: int
     name: str
@@ -58,12 +150,45 @@ class BrightnessService:
         0x8C: "Hue",
     }
 
+    _HANDLE_IDLE_TTL_SECONDS = 30.0
+    _VCP_CACHE_SCHEMA_VERSION = 2
+    _BASE_RETRY_SLEEP_SECONDS = 0.005
+    _SLEEP_MULTIPLIER_FLOOR = 0.1
+    _SLEEP_MULTIPLIER_CAP = 4.0
+
+    _PICTURE_CACHE_CAPACITY = 16
+
     def __init__(self) -> None:
         self.monitors: list[MonitorHandle] = []
-        self._picture_controls_cache: dict[str, list[PictureControl]] = {}
+        # LRU-ordered and capacity-bounded so docking-station workflows with
+        # many transient monitors cannot grow it without limit.
+        self._picture_controls_cache: OrderedDict[str, list[PictureControl]] = OrderedDict()
+        self._vcp_cache_path = get_default_config_path().parent / VCP_CACHE_FILE_NAME
+        # EDID-hash keyed mirror of the picture-controls cache; loaded lazily
+        # and written back after each fresh probe so restarts skip the probe.
+        self._vcp_disk_cache: dict[str, dict[str, Any]] | None = None
+        # Pending debounce timers for coalesced writes; last value wins.
+        self._pending_brightness_writes: dict[str, threading.Timer] = {}
+        self._pending_control_writes: dict[tuple[str, int], threading.Timer] = {}
+        # Monitors vary wildly in how long DDC/CI needs between retries, so
+        # the retry sleep scales per monitor: stepped down by 0.1 toward the
+        # floor per clean first-try success, doubled toward the cap after
+        # failures.
+        self._sleep_multiplier: dict[str, float] = {}
+        # Physical monitor handles are expensive to open (one DDC/CI round
+        # trip each), so keep them warm per display index and only destroy
+        # them after sitting idle or when the monitor set changes.
+        self._vcp_handle_cache: dict[int, tuple[Any, float]] = {}
+        # The bulk probe runs on pool threads, so handle-cache bookkeeping
+        # and disk-cache load/write must be serialized: unsynchronized
+        # eviction can double-destroy a handle or cache a destroyed one as
+        # live, and concurrent write_text calls corrupt the cache file.
+        self._vcp_handle_lock = threading.Lock()
+        self._vcp_disk_cache_lock = threading.Lock()
 
     def refresh_monitors(self) -> list[MonitorHandle]:
-        raw_monitors = sbc.list_monitors_info(allow_duplicates=False)
+        self._invalidate_vcp_handles()
+        raw_monitors = _get_sbc().list_monitors_info(allow_duplicates=False)
         parsed: list[MonitorHandle] = []
         seen_keys: dict[str, int] = {}
 
@@ -76,12 +201,135 @@ class BrightnessService:
         stale_keys = [key for key in self._picture_controls_cache if key not in active_keys]
         for key in stale_keys:
             self._picture_controls_cache.pop(key, None)
+        self._preload_picture_controls_from_disk(parsed)
         return list(self.monitors)
 
+    def _load_vcp_disk_cache(self) -> dict[str, dict[str, Any]]:
+        if self._vcp_disk_cache is not None:
+            return self._vcp_disk_cache
+
+        with self._vcp_disk_cache_lock:
+            # Re-check under the lock: a pool thread may have finished the
+            # load while this one was waiting, and two loads would leave one
+            # thread mutating a dict the other discards.
+            if self._vcp_disk_cache is not None:
+                return self._vcp_disk_cache
+
+            entries: dict[str, dict[str, Any]] = {}
+            try:
+                raw_data = json.loads(self._vcp_cache_path.read_text(encoding="utf-8"))
+            except (OSError, json.JSONDecodeError):
+                raw_data = None
+            if (
+                isinstance(raw_data, dict)
+                and raw_data.get("schema_version") == self._VCP_CACHE_SCHEMA_VERSION
+                and isinstance(raw_data.get("monitors"), dict)
+            ):
+                entries = raw_data["monitors"]
+            self._vcp_disk_cache = entries
+            return entries
+
+    def _preload_picture_controls_from_disk(self, monitors: list[MonitorHandle]) -> None:
+        disk_cache = self._load_vcp_disk_cache()
+        if not disk_cache:
+            return
+        for monitor in monitors:
+            if monitor.edid_hash is None:
+                continue
+            entry = disk_cache.get(monitor.edid_hash)
+            if not isinstance(entry, dict):
+                continue
+            is_ddc = entry.get("is_ddc")
+            if isinstance(is_ddc, bool):
+                monitor.is_ddc = is_ddc
+            if monitor.key in self._picture_controls_cache:
+                continue
+            raw_controls = entry.get("controls")
+            if not isinstance(raw_controls, list):
+                continue
+            controls = self._picture_controls_from_entries(raw_controls)
+            if controls:
+                self._cache_picture_controls(monitor.key, controls)
+
+    @staticmethod
+    def _picture_controls_from_entries(entries: list[Any]) -> list[PictureControl]:
+        controls: list[PictureControl] = []
+        for entry in entries:
+            if not isinstance(entry, dict):
+                continue
+            try:
+                controls.append(
+                    PictureControl(
+                        code=int(entry["code"]),
+                        name=str(entry["name"]),
+                        minimum=int(entry["minimum"]),
+                        maximum=int(entry["maximum"]),
+                        value=int(entry["value"]),
+                    )
+                )
+            except (KeyError, TypeError, ValueError):
+                continue
+        return controls
+
+    def _vcp_disk_entry(self, monitor: MonitorHandle) -> dict[str, Any] | None:
+        # Caller holds _vcp_disk_cache_lock; mutating entries and dumping the
+        # cache must not interleave across pool threads.
+        if monitor.edid_hash is None:
+            return None
+        disk_cache = self._vcp_disk_cache or {}
+        entry = disk_cache.get(monitor.edid_hash)
+        if not isinstance(entry, dict):
+            entry = {}
+            disk_cache[monitor.edid_hash] = entry
+        return entry
+
+    def _write_vcp_disk_cache(self) -> None:
+        # Caller holds _vcp_disk_cache_lock, which keeps concurrent probes
+        # from interleaving whole-file writes of the same cache path.
+        payload = {
+            "schema_version": self._VCP_CACHE_SCHEMA_VERSION,
+            "monitors": self._vcp_disk_cache or {},
+        }
+        try:
+            self._vcp_cache_path.parent.mkdir(parents=True, exist_ok=True)
+            self._vcp_cache_path.write_text(json.dumps(payload), encoding="utf-8")
+        except OSError:
+            pass
+
+    def _store_picture_controls_to_disk(
+        self, monitor: MonitorHandle, controls: list[PictureControl]
+    ) -> None:
+        self._load_vcp_disk_cache()
+        with self._vcp_disk_cache_lock:
+            entry = self._vcp_disk_entry(monitor)
+            if entry is None:
+                return
+            entry["controls"] = [
+                {
+                    "code": control.code,
+                    "name": control.name,
+                    "minimum": control.minimum,
+                    "maximum": control.maximum,
+                    "value": control.value,
+                }
+                for control in controls
+            ]
+            entry["is_ddc"] = True
+            self._write_vcp_disk_cache()
+
+    def _store_ddc_flag_to_disk(self, monitor: MonitorHandle, is_ddc: bool) -> None:
+        self._load_vcp_disk_cache()
+        with self._vcp_disk_cache_lock:
+            entry = self._vcp_disk_entry(monitor)
+            if entry is None:
+                return
+            entry["is_ddc"] = is_ddc
+            self._write_vcp_disk_cache()
+
     def get_brightness(self, monitor: MonitorHandle) -> int | None:
         for call_kwargs in self._build_call_args(monitor):
             try:
-                value = sbc.get_brightness(**call_kwargs)
+                value = _get_sbc().get_brightness(**call_kwargs)
                 if isinstance(value, list):
                     value = value[0]
                 return clamp_brightness(value)
@@ -89,16 +337,103 @@ class BrightnessService:
                 continue
         return None
 
+    def get_brightness_all(self) -> dict[str, int | None]:
+        """Read brightness for every known monitor, overlapping DDC waits.
+
+        Each monitor has its own handle and the dxva2 calls release the GIL,
+        so the mandated DDC/CI sleeps run concurrently instead of serially.
+        """
+        monitors = list(self.monitors)
+        if not monitors:
+            return {}
+        if len(monitors) == 1:
+            only = monitors[0]
+            return {only.key: self.get_brightness(only)}
+        with ThreadPoolExecutor(max_workers=len(monitors)) as pool:
+            values = list(pool.map(self.get_brightness, monitors))
+        return {monitor.key: value for monitor, value in zip(monitors, values)}
+
+    def list_picture_controls_all(
+        self,
+        use_cache: bool = True,
+        include_capabilities: bool = False,
+    ) -> dict[str, list[PictureControl]]:
+        """Probe picture controls for every known monitor concurrently.
+
+        Per-monitor failures surface as empty lists so one misbehaving
+        display cannot hide the others' controls.
+        """
+        monitors = list(self.monitors)
+        if not monitors:
+            return {}
+
+        def probe(monitor: MonitorHandle) -> list[PictureControl]:
+            try:
+                return self.list_picture_controls(
+                    monitor,
+                    use_cache=use_cache,
+                    include_capabilities=include_capabilities,
+                )
+            except Exception:
+                return []
+
+        if len(monitors) == 1:
+            return {monitors[0].key: probe(monitors[0])}
+        with ThreadPoolExecutor(max_workers=len(monitors)) as pool:
+            results = list(pool.map(probe, monitors))
+        return {monitor.key: controls for monitor, controls in zip(monitors, results)}
+
     def set_brightness(self, monitor: MonitorHandle, value: int) -> bool:
         target = clamp_brightness(value)
         for call_kwargs in self._build_call_args(monitor):
             try:
-                sbc.set_brightness(target, **call_kwargs)
+                _get_sbc().set_brightness(target, **call_kwargs)
                 return True
             except Exception:
                 continue
         return False
 
+    def set_brightness_debounced(
+        self, monitor: MonitorHandle, value: int, interval: float = 0.08
+    ) -> None:
+        """Coalesce rapid set_brightness calls during a slider drag.
+
+        Each call cancels the pending write for the monitor and reschedules
+        it, so only the value the slider comes to rest on hits the DDC bus.
+        """
+        pending = self._pending_brightness_writes.pop(monitor.key, None)
+        if pending is not None:
+            pending.cancel()
+        timer = threading.Timer(
+            interval, self._flush_brightness_write, args=(monitor, value)
+        )
+        timer.daemon = True
+        self._pending_brightness_writes[monitor.key] = timer
+        timer.start()
+
+    def _flush_brightness_write(self, monitor: MonitorHandle, value: int) -> None:
+        self._pending_brightness_writes.pop(monitor.key, None)
+        self.set_brightness(monitor, value)
+
+    def set_picture_control_debounced(
+        self, monitor: MonitorHandle, code: int, value: int, interval: float = 0.08
+    ) -> None:
+        """Coalesce rapid set_picture_control calls per (monitor, code)."""
+        write_key = (monitor.key, int(code))
+        pending = self._pending_control_writes.pop(write_key, None)
+        if pending is not None:
+            pending.cancel()
+        timer = threading.Timer(
+            interval, self._flush_control_write, args=(monitor, code, value)
+        )
+        timer.daemon = True
+        self._pending_control_writes[write_key] = timer
+        timer.start()
+
+    def _flush_control_write(self, monitor: MonitorHandle, code: int, value: int) -> None:
+        self._pending_control_writes.pop((monitor.key, int(code)), None)
+        self.set_picture_control(monitor, code, value)
+
     def list_picture_controls(
         self,
         monitor: MonitorHandle,
@@ -107,34 +442,57 @@ class BrightnessService:
     ) -> list[PictureControl]:
         if self._normalize_method(monitor.method_name) != "vcp":
             return []
+        if monitor.is_ddc is False and not use_cache:
+            # A single failed read (a monitor waking from sleep, a flaky
+            # cable) must not disable controls permanently: an explicit
+            # refresh re-probes and overwrites the persisted verdict.
+            monitor.is_ddc = None
+        if monitor.is_ddc is None:
+            self.probe_ddc_support(monitor)
+        if monitor.is_ddc is False:
+            return []
         if use_cache:
             cached_controls = self._picture_controls_cache.get(monitor.key)
             if cached_controls is not None:
-                return self._clone_picture_controls(cached_controls)
+                self._picture_controls_cache.move_to_end(monitor.key)
+                # PictureControl is frozen, so sharing instances is safe; the
+                # shallow list copy only guards against caller list mutation.
+                return list(cached_controls)
 
         with self._open_vcp_monitor_handle(monitor.display_index) as (has_handle, handle):
             if not has_handle:
                 return []
 
-            candidate_codes = self._candidate_picture_codes(
+            candidate_codes, value_hints = self._candidate_picture_codes(
                 handle,
                 include_capabilities=include_capabilities,
             )
             controls: list[PictureControl] = []
             seen_codes: set[int] = set()
+            scratch = (
+                (DWORD(), DWORD())
+                if _GetVCPFeatureAndVCPFeatureReply is not None
+                else None
+            )
 
             for code in candidate_codes:
                 if code in seen_codes:
                     continue
                 seen_codes.add(code)
 
-                feature = self._read_vcp_feature(handle, code, max_tries=2)
+                feature = self._read_vcp_feature(
+                    handle, code, max_tries=2, monitor_key=monitor.key, scratch=scratch
+                )
                 if feature is None:
                     continue
 
                 current, maximum = feature
                 if maximum <= 0:
-                    continue
+                    # Some monitors report a zero maximum for features whose
+                    # legal values the capabilities string already declared.
+                    maximum = value_hints.get(code, 0)
+                    if maximum <= 0:
+                        continue
 
                 minimum = 0
                 upper_bound = max(maximum, current)
@@ -149,9 +507,40 @@ class BrightnessService:
                     )
                 )
 
-            cloned_controls = self._clone_picture_controls(controls)
-            self._picture_controls_cache[monitor.key] = cloned_controls
-            return self._clone_picture_controls(cloned_controls)
+            self._cache_picture_controls(monitor.key, controls)
+            self._store_picture_controls_to_disk(monitor, controls)
+            return list(controls)
+
+    def _cache_picture_controls(self, key: str, controls: list[PictureControl]) -> None:
+        cache = self._picture_controls_cache
+        cache[key] = controls
+        cache.move_to_end(key)
+        while len(cache) > self._PICTURE_CACHE_CAPACITY:
+            cache.popitem(last=False)
+
+    def probe_ddc_support(self, monitor: MonitorHandle) -> bool:
+        """Check once whether a display actually answers DDC/CI.
+
+        A single luminance read (VCP 0x10) decides; displays that fail it,
+        typically internal panels, are flagged so picture-control probing
+        never hangs on them again. The verdict persists in the disk cache.
+        """
+        if self._normalize_method(monitor.method_name) != "vcp":
+            monitor.is_ddc = False
+            return False
+        if monitor.is_ddc is not None:
+            return monitor.is_ddc
+
+        with self._open_vcp_monitor_handle(monitor.display_index) as (has_handle, handle):
+            if not has_handle:
+                monitor.is_ddc = False
+            else:
+                feature = self._read_vcp_feature(
+                    handle, 0x10, max_tries=2, monitor_key=monitor.key
+                )
+                monitor.is_ddc = feature is not None
+        self._store_ddc_flag_to_disk(monitor, monitor.is_ddc)
+        return monitor.is_ddc
 
     def set_picture_control(self, monitor: MonitorHandle, code: int, value: int) -> bool:
         if self._normalize_method(monitor.method_name) != "vcp":
@@ -163,17 +552,26 @@ class BrightnessService:
             if not has_handle:
                 return False
 
-            success = self._write_vcp_feature(handle, normalized_code, target_value)
+            success = self._write_vcp_feature(
+                handle, normalized_code, target_value, monitor_key=monitor.key
+            )
             if not success:
+                # Failed writes cast doubt on the cached control state, so
+                # drop the entry and let the next read re-probe.
+                self._picture_controls_cache.pop(monitor.key, None)
                 return False
 
             cached_controls = self._picture_controls_cache.get(monitor.key)
             if cached_controls is None:
                 return True
-            for control in cached_controls:
+            for index, control in enumerate(cached_controls):
                 if control.code != normalized_code:
                     continue
-                control.value = max(control.minimum, min(control.maximum, target_value))
+                cached_controls[index] = replace(
+                    control,
+                    value=max(control.minimum, min(control.maximum, target_value)),
+                )
+                self._store_picture_controls_to_disk(monitor, cached_controls)
                 break
             return True
 
@@ -207,30 +605,49 @@ class BrightnessService:
         seen_keys[base_key] = count + 1
         key = base_key if count == 0 else f"{base_key}|{count}"
 
+        edid_hash: str | None = None
+        raw_edid = raw_monitor.get("edid")
+        if raw_edid:
+            edid_bytes = (
+                raw_edid
+                if isinstance(raw_edid, (bytes, bytearray))
+                else str(raw_edid).encode("utf-8", errors="ignore")
+            )
+            edid_hash = hashlib.blake2b(edid_bytes, digest_size=8).hexdigest()
+
         return MonitorHandle(
             key=key,
             name=name,
             display_index=display_index,
             method_name=method_name,
+            edid_hash=edid_hash,
         )
 
     @staticmethod
-    def _build_call_args(monitor: MonitorHandle) -> list[dict[str, Any]]:
+    def _build_call_args(monitor: MonitorHandle) -> tuple[dict[str, Any], ...]:
+        cached = monitor._call_args
+        if cached is not None:
+            return cached
+
         call_args: list[dict[str, Any]] = []
         method = BrightnessService._normalize_method(monitor.method_name)
         if method:
             call_args.append({"display": monitor.display_index, "method": method})
         call_args.append({"display": monitor.display_index})
-        return call_args
+        monitor._call_args = tuple(call_args)
+        return monitor._call_args
 
     def _candidate_picture_codes(
         self,
         monitor_handle: Any,
         include_capabilities: bool,
-    ) -> list[int]:
+    ) -> tuple[list[int], dict[int, int]]:
         capabilities_codes: list[int] = []
+        value_hints: dict[int, int] = {}
         if include_capabilities:
-            capabilities_codes = self._read_vcp_codes_from_capabilities(monitor_handle)
+            capabilities_codes, value_hints = self._read_vcp_codes_from_capabilities(
+                monitor_handle
+            )
         if capabilities_codes:
             capabilities_set = set(capabilities_codes)
             candidates = [code for code in self._PICTURE_CODE_ORDER if code in capabilities_set]
@@ -241,23 +658,9 @@ class BrightnessService:
                     continue
                 candidates.append(code)
             if candidates:
-                return candidates
-
-        candidates = list(self._PICTURE_CODE_ORDER)
-        return candidates
+                return candidates, value_hints
 
-    @staticmethod
-    def _clone_picture_controls(controls: list[PictureControl]) -> list[PictureControl]:
-        return [
-            PictureControl(
-                code=control.code,
-                name=control.name,
-                minimum=control.minimum,
-                maximum=control.maximum,
-                value=control.value,
-            )
-            for control in controls
-        ]
+        return list(self._PICTURE_CODE_ORDER), value_hints
 
     @classmethod
     def _picture_control_name(cls, code: int) -> str:
@@ -271,64 +674,131 @@ class BrightnessService:
             return True
         return False
 
-    @staticmethod
     @contextmanager
-    def _open_vcp_monitor_handle(display_index: int):
-        if os.name != "nt":
+    def _open_vcp_monitor_handle(self, display_index: int):
+        # Lookup and timestamp refresh happen atomically so a concurrent
+        # eviction pass cannot destroy the handle between them.
+        with self._vcp_handle_lock:
+            cached = self._vcp_handle_cache.get(display_index)
+            if cached is not None:
+                handle, _last_used = cached
+                self._vcp_handle_cache[display_index] = (handle, time.monotonic())
+        if cached is not None:
+            try:
+                yield (True, handle)
+            finally:
+                self._evict_idle_vcp_handles()
+            return
+
+        handle = self._open_physical_monitor(display_index)
+        if handle is None:
             yield (False, None)
             return
 
+        surplus_handle = None
+        with self._vcp_handle_lock:
+            existing = self._vcp_handle_cache.get(display_index)
+            if existing is not None:
+                # Another pool thread opened the same display while this one
+                # was blocked in the DDC open; keep its handle, drop ours.
+                surplus_handle = handle
+                handle, _last_used = existing
+            self._vcp_handle_cache[display_index] = (handle, time.monotonic())
+        if surplus_handle is not None:
+            self._destroy_physical_monitor(surplus_handle)
+        try:
+            yield (True, handle)
+        finally:
+            self._evict_idle_vcp_handles()
+
+    @staticmethod
+    def _open_physical_monitor(display_index: int) -> Any | None:
+        if os.name != "nt":
+            return None
+
         try:
             import screen_brightness_control.windows as sbc_windows
         except Exception:
-            yield (False, None)
-            return
+            return None
 
         monitor_iterator = sbc_windows.VCP.iter_physical_monitors(start=display_index)
-        handle = None
-        has_handle = False
         try:
-            handle = next(monitor_iterator)
-            has_handle = True
-        except StopIteration:
-            handle = None
-            has_handle = False
+            return next(monitor_iterator)
         except Exception:
-            handle = None
-            has_handle = False
-
-        try:
-            yield (has_handle, handle)
+            return None
         finally:
-            if has_handle:
-                try:
-                    from ctypes import windll
-
-                    windll.dxva2.DestroyPhysicalMonitor(handle)
-                except Exception:
-                    pass
             try:
                 monitor_iterator.close()
             except Exception:
                 pass
 
     @staticmethod
+    def _destroy_physical_monitor(handle: Any) -> None:
+        if _DestroyPhysicalMonitor is None:
+            return
+        try:
+            _DestroyPhysicalMonitor(handle)
+        except Exception:
+            pass
+
+    def _evict_idle_vcp_handles(self) -> None:
+        now = time.monotonic()
+        # Expired entries are unlinked under the lock so concurrent passes
+        # cannot each claim (and double-destroy) the same handle; the slow
+        # DestroyPhysicalMonitor calls then run outside it.
+        with self._vcp_handle_lock:
+            expired = [
+                (display_index, handle)
+                for display_index, (handle, last_used) in self._vcp_handle_cache.items()
+                if now - last_used >= self._HANDLE_IDLE_TTL_SECONDS
+            ]
+            for display_index, _handle in expired:
+                del self._vcp_handle_cache[display_index]
+        for _display_index, handle in expired:
+            self._destroy_physical_monitor(handle)
+
+    def _invalidate_vcp_handles(self) -> None:
+        with self._vcp_handle_lock:
+            handles = [handle for handle, _last_used in self._vcp_handle_cache.values()]
+            self._vcp_handle_cache.clear()
+        for handle in handles:
+            self._destroy_physical_monitor(handle)
+
+    def _retry_sleep(self, monitor_key: str | None, attempt: int) -> None:
+        multiplier = self._sleep_multiplier.get(monitor_key, 1.0) if monitor_key else 1.0
+        time.sleep(self._BASE_RETRY_SLEEP_SECONDS * multiplier * (attempt + 1))
+
+    def _note_vcp_result(self, monitor_key: str | None, retried: bool, success: bool) -> None:
+        if monitor_key is None:
+            return
+        multiplier = self._sleep_multiplier.get(monitor_key, 1.0)
+        if not success:
+            multiplier = min(self._SLEEP_MULTIPLIER_CAP, multiplier * 2.0)
+        elif not retried:
+            multiplier = max(self._SLEEP_MULTIPLIER_FLOOR, multiplier - 0.1)
+        self._sleep_multiplier[monitor_key] = multiplier
+
     def _read_vcp_feature(
+        self,
         monitor_handle: Any,
         code: int,
         max_tries: int = 2,
+        monitor_key: str | None = None,
+        scratch: tuple[Any, Any] | None = None,
     ) -> tuple[int, int] | None:
-        try:
-            from ctypes import byref, windll
-            from ctypes.wintypes import BYTE, DWORD
-        except Exception:
+        if _GetVCPFeatureAndVCPFeatureReply is None:
             return None
 
-        code_byte = BYTE(max(0, min(0xFF, int(code))))
-        for attempt in range(max_tries):
+        # Callers probing many codes pass a (DWORD, DWORD) scratch pair so
+        # the out-params are allocated once per probe, not per code.
+        if scratch is not None:
+            current, maximum = scratch
+        else:
             current = DWORD()
             maximum = DWORD()
-            success = windll.dxva2.GetVCPFeatureAndVCPFeatureReply(
+        code_byte = max(0, min(0xFF, int(code)))
+        for attempt in range(max_tries):
+            success = _GetVCPFeatureAndVCPFeatureReply(
                 monitor_handle,
                 code_byte,
                 None,
@@ -336,55 +806,57 @@ class BrightnessService:
                 byref(maximum),
             )
             if success:
+                self._note_vcp_result(monitor_key, retried=attempt > 0, success=True)
                 return int(current.value), int(maximum.value)
-            time.sleep(0.01 if attempt < 1 else 0.03)
+            self._retry_sleep(monitor_key, attempt)
+        self._note_vcp_result(monitor_key, retried=True, success=False)
         return None
 
-    @staticmethod
     def _write_vcp_feature(
+        self,
         monitor_handle: Any,
         code: int,
         value: int,
         max_tries: int = 2,
+        monitor_key: str | None = None,
     ) -> bool:
-        try:
-            from ctypes import windll
-            from ctypes.wintypes import BYTE, DWORD
-        except Exception:
+        if _SetVCPFeature is None:
             return False
 
-        code_byte = BYTE(max(0, min(0xFF, int(code))))
-        target_value = DWORD(max(0, int(value)))
+        code_byte = max(0, min(0xFF, int(code)))
+        target_value = max(0, int(value))
         for attempt in range(max_tries):
-            success = windll.dxva2.SetVCPFeature(monitor_handle, code_byte, target_value)
+            success = _SetVCPFeature(monitor_handle, code_byte, target_value)
             if success:
+                self._note_vcp_result(monitor_key, retried=attempt > 0, success=True)
                 return True
-            time.sleep(0.01 if attempt < 1 else 0.03)
+            self._retry_sleep(monitor_key, attempt)
+        self._note_vcp_result(monitor_key, retried=True, success=False)
         return False
 
     @classmethod
-    def _read_vcp_codes_from_capabilities(cls, monitor_handle: Any) -> list[int]:
+    def _read_vcp_codes_from_capabilities(
+        cls, monitor_handle: Any
+    ) -> tuple[list[int], dict[int, int]]:
         capabilities = cls._read_capabilities_string(monitor_handle)
         if not capabilities:
-            return []
-        return cls._extract_vcp_codes(capabilities)
+            return [], {}
+        codes = cls._extract_vcp_codes(capabilities)
+        return codes, cls._extract_vcp_value_hints(capabilities, codes)
 
     @staticmethod
     def _read_capabilities_string(monitor_handle: Any) -> str | None:
-        try:
-            from ctypes import byref, create_string_buffer, windll
-            from ctypes.wintypes import DWORD
-        except Exception:
+        if _GetCapabilitiesStringLength is None:
             return None
 
         length = DWORD()
-        if not windll.dxva2.GetCapabilitiesStringLength(monitor_handle, byref(length)):
+        if not _GetCapabilitiesStringLength(monitor_handle, byref(length)):
             return None
         if length.value <= 0 or length.value > 32_768:
             return None
 
         buffer = create_string_buffer(length.value)
-        if not windll.dxva2.CapabilitiesRequestAndCapabilitiesReply(
+        if not _CapabilitiesRequestAndCapabilitiesReply(
             monitor_handle,
             buffer,
             length,
@@ -396,90 +868,91 @@ class BrightnessService:
             return None
         return raw.decode("ascii", errors="ignore")
 
-    @staticmethod
-    def _extract_vcp_codes(capabilities: str) -> list[int]:
-        marker = "vcp("
-        lowered = capabilities.lower()
-        start = lowered.find(marker)
-        if start < 0:
+    _VCP_BLOCK_RE = re.compile(r"vcp\(", re.IGNORECASE)
+    _NESTED_GROUP_RE = re.compile(r"\([^()]*\)")
+    _HEX_TOKEN_RE = re.compile(r"(?<!\S)([0-9A-Fa-f]{2})(?!\S)")
+
+    @classmethod
+    def _extract_vcp_codes(cls, capabilities: str) -> list[int]:
+        match = cls._VCP_BLOCK_RE.search(capabilities)
+        if match is None:
             return []
 
-        cursor = start + len(marker)
-        depth = 1
-        payload_chars: list[str] = []
-        while cursor < len(capabilities):
-            character = capabilities[cursor]
-            if character == "(":
-                depth += 1
-            elif character == ")":
-                depth -= 1
-                if depth == 0:
-                    break
-            payload_chars.append(character)
-            cursor += 1
-
-        payload = "".join(payload_chars)
-        codes: list[int] = []
-        token_chars: list[str] = []
-        nested_depth = 0
-
-        def flush_token() -> None:
-            if not token_chars:
-                return
-            token = "".join(token_chars)
-            token_chars.clear()
-            if re.fullmatch(r"[0-9a-fA-F]{2}", token):
-                codes.append(int(token, 16))
-
-        for character in payload:
-            if character == "(":
-                if nested_depth == 0:
-                    flush_token()
-                nested_depth += 1
-                continue
-            if character == ")":
-                if nested_depth > 0:
-                    nested_depth -= 1
-                if nested_depth == 0:
-                    token_chars.clear()
-                continue
-            if nested_depth > 0:
-                continue
-            if character.isspace():
-                flush_token()
-                continue
-            token_chars.append(character)
-        flush_token()
+        # Strip nested value groups with the C regex engine instead of a
+        # Python character walk; the loop runs once per nesting level (2-3
+        # for real capabilities strings). Once no balanced groups remain,
+        # the first ")" left is the close of the vcp block itself.
+        payload = capabilities[match.end():]
+        while True:
+            stripped = cls._NESTED_GROUP_RE.sub(" ", payload)
+            if stripped == payload:
+                break
+            payload = stripped
+        end = payload.find(")")
+        if end >= 0:
+            payload = payload[:end]
 
-        return codes
+        return [int(token, 16) for token in cls._HEX_TOKEN_RE.findall(payload)]
+
+    _VCP_VALUE_GROUP_RE = re.compile(r"([0-9A-Fa-f]{2})\(([^()]*)\)")
+    _HEX_PAIR_RE = re.compile(r"(?<!\S)[0-9A-Fa-f]{1,2}(?!\S)")
+
+    @classmethod
+    def _extract_vcp_value_hints(
+        cls, capabilities: str, codes: list[int]
+    ) -> dict[int, int]:
+        """Map VCP codes to the largest value their capabilities list allows.
+
+        MCCS value-list groups like ``14(05 08 0B)`` declare the feature's
+        legal values; their maximum stands in for a bogus hardware-reported
+        one. Matches are intersected with the declared vcp codes so groups
+        from other capability blocks cannot sneak in.
+        """
+        if not codes:
+            return {}
+        code_set = set(codes)
+        hints: dict[int, int] = {}
+        for match in cls._VCP_VALUE_GROUP_RE.finditer(capabilities):
+            code = int(match.group(1), 16)
+            if code not in code_set:
+                continue
+            values = [
+                int(token, 16)
+                for token in cls._HEX_PAIR_RE.findall(match.group(2))
+            ]
+            if values:
+                hints[code] = max(values)
+        return hints
 
     @staticmethod
     def _normalize_method(method_name: str | None) -> str | None:
-        if not method_name:
-            return None
-        lower_name = method_name.lower()
-        if "wmi" in lower_name:
-            return "wmi"
-        if "vcp" in lower_name:
-            return "vcp"
-        return None
+        try:
+            return _NORMALIZED_METHODS[method_name]
+        except KeyError:
+            pass
+
+        normalized: str | None = None
+        if method_name:
+            lower_name = method_name.lower()
+            if "wmi" in lower_name:
+                normalized = "wmi"
+            elif "vcp" in lower_name:
+                normalized = "vcp"
+        _NORMALIZED_METHODS[method_name] = normalized
+        return normalized
 
     @staticmethod
+    @lru_cache(maxsize=64)
     def _is_generic_monitor_name(name: str) -> bool:
-        normalized = re.sub(r"\s+", " ", name.strip().lower())
-        if normalized.startswith("none "):
+        # Called per monitor on every refresh with a handful of recurring
+        # names, so the verdict is cached and the pattern/set prebuilt.
+        normalized = _WHITESPACE_RE.sub(" ", name.strip().lower())
+        if normalized.startswith(("none ", "display ")):
             return True
-        return normalized in {
-            "",
-            "none",
-            "display",
-            "internal display",
-            "built-in display",
-            "generic pnp monitor",
-            "generic monitor",
-        } or normalized.startswith("display ")
+        return normalized in _GENERIC_MONITOR_NAMES
 
     @staticmethod
+    @lru_cache(maxsize=1)
     def _query_windows_device_name() -> str | None:
         if os.name != "nt":
             return None
@@ -512,7 +985,10 @@ class BrightnessService:
         return name
 
     @staticmethod
+    @lru_cache(maxsize=1)
     def system_device_name() -> str | None:
+        # The computer name cannot change without a reboot, so both this and
+        # the registry lookup above are cached for the process lifetime.
         registry_name = BrightnessService._query_windows_device_name()
         if registry_name:
             return BrightnessService._normalize_device_name_for_ui(registry_name)
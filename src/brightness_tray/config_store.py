@@ -1,16 +1,23 @@
 from __future__ import annotations
 
+import hashlib
 import json
 import os
 import re
 from pathlib import Path
 from typing import Any
 
+try:  # Rust JSON codec; several times faster for the rules-heavy config.
+    import orjson
+except ImportError:
+    orjson = None
+
 from .models import (
     AppConfig,
     ScheduleRule,
     ScheduleSettings,
     clamp_brightness,
+    clamp_brightness_int,
     default_schedule_rules,
 )
 from .themes import normalize_theme_name
@@ -19,6 +26,8 @@ from .themes import normalize_theme_name
 APP_FOLDER_NAME = "BrightnessTrayScheduler"
 CONFIG_FILE_NAME = "config.json"
 
+_TIME_RE = re.compile(r"(\d{1,2}):(\d{2})")
+
 
 def get_default_config_path() -> Path:
     appdata = os.getenv("APPDATA")
@@ -30,6 +39,7 @@ def get_default_config_path() -> Path:
 class ConfigStore:
     def __init__(self, config_path: Path | None = None) -> None:
         self.config_path = config_path or get_default_config_path()
+        self._last_saved_digest: str | None = None
 
     def load(self) -> AppConfig:
         if not self.config_path.exists():
@@ -38,8 +48,11 @@ class ConfigStore:
             return config
 
         try:
-            raw_data = json.loads(self.config_path.read_text(encoding="utf-8"))
-        except (json.JSONDecodeError, OSError):
+            if orjson is not None:
+                raw_data = orjson.loads(self.config_path.read_bytes())
+            else:
+                raw_data = json.loads(self.config_path.read_text(encoding="utf-8"))
+        except (ValueError, OSError):
             config = AppConfig()
             self.save(config)
             return config
@@ -47,15 +60,15 @@ class ConfigStore:
         return self._parse(raw_data)
 
     def save(self, config: AppConfig) -> None:
-        self.config_path.parent.mkdir(parents=True, exist_ok=True)
         payload = {
             "version": config.version,
             "theme": normalize_theme_name(config.theme),
             "link_mode": bool(config.link_mode),
             "ambient_auto_enabled": bool(config.ambient_auto_enabled),
-            "last_global_brightness": clamp_brightness(config.last_global_brightness),
+            "last_global_brightness": clamp_brightness_int(config.last_global_brightness),
             "monitor_levels": {
-                key: clamp_brightness(value) for key, value in config.monitor_levels.items()
+                key: clamp_brightness_int(value)
+                for key, value in config.monitor_levels.items()
             },
             "startup_enabled": bool(config.startup_enabled),
             "schedule": {
@@ -68,7 +81,7 @@ class ConfigStore:
                     {
                         "anchor": rule.anchor,
                         "offset_minutes": int(rule.offset_minutes),
-                        "brightness": clamp_brightness(rule.brightness),
+                        "brightness": clamp_brightness_int(rule.brightness),
                         "target": rule.target,
                         "specific_time": rule.specific_time,
                     }
@@ -76,7 +89,21 @@ class ConfigStore:
                 ],
             },
         }
-        self.config_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        if orjson is not None:
+            serialized = orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+        else:
+            serialized = json.dumps(payload, indent=2).encode("utf-8")
+        digest = hashlib.blake2b(serialized, digest_size=16).hexdigest()
+        if digest == self._last_saved_digest:
+            return
+
+        # Write via a temp file and atomic rename so a crash mid-save can
+        # never leave a truncated config behind.
+        self.config_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.config_path.with_suffix(".json.tmp")
+        temp_path.write_bytes(serialized)
+        os.replace(temp_path, self.config_path)
+        self._last_saved_digest = digest
 
     def _parse(self, data: dict[str, Any]) -> AppConfig:
         config = AppConfig()
@@ -113,40 +140,26 @@ class ConfigStore:
         if not isinstance(raw_rules, list):
             return default_schedule_rules()
 
+        # ScheduleRule.__post_init__ owns normalization and validation;
+        # malformed entries raise and are simply skipped.
         parsed: list[ScheduleRule] = []
         for raw_rule in raw_rules:
             if not isinstance(raw_rule, dict):
                 continue
-            anchor = str(raw_rule.get("anchor", "")).strip().lower()
-            if anchor not in ("sunrise", "sunset", "time"):
-                continue
-
             try:
-                offset_minutes = int(raw_rule.get("offset_minutes", 0))
-            except (TypeError, ValueError):
-                offset_minutes = 0
-            offset_minutes = max(-1440, min(1440, offset_minutes))
-
-            target = str(raw_rule.get("target", "both")).strip().lower()
-            if target not in ("display1", "display2", "both"):
-                target = "both"
-
-            specific_time: str | None = None
-            if anchor == "time":
-                specific_time = self._normalize_time_text(raw_rule.get("specific_time"))
-                if specific_time is None:
-                    continue
-                offset_minutes = 0
-
-            parsed.append(
-                ScheduleRule(
-                    anchor=anchor,
-                    offset_minutes=offset_minutes,
-                    brightness=clamp_brightness(raw_rule.get("brightness", 100)),
-                    target=target,
-                    specific_time=specific_time,
+                parsed.append(
+                    ScheduleRule(
+                        anchor=raw_rule.get("anchor", ""),
+                        offset_minutes=raw_rule.get("offset_minutes", 0),
+                        brightness=raw_rule.get("brightness", 100),
+                        target=raw_rule.get("target", "both"),
+                        specific_time=self._normalize_time_text(
+                            raw_rule.get("specific_time")
+                        ),
+                    )
                 )
-            )
+            except (TypeError, ValueError):
+                continue
 
         if not parsed:
             return default_schedule_rules()
@@ -164,12 +177,11 @@ class ConfigStore:
     @staticmethod
     def _normalize_time_text(value: Any) -> str | None:
         text = str(value or "").strip()
-        if not re.fullmatch(r"\d{1,2}:\d{2}", text):
-            return None
-        try:
-            hour, minute = [int(piece) for piece in text.split(":")]
-        except (TypeError, ValueError):
+        match = _TIME_RE.fullmatch(text)
+        if match is None:
             return None
-        if hour < 0 or hour > 23 or minute < 0 or minute > 59:
+        hour = int(match.group(1))
+        minute = int(match.group(2))
+        if hour > 23 or minute > 59:
             return None
         return f"{hour:02d}:{minute:02d}"
@@ -1,6 +1,12 @@
 from __future__ import annotations
 
+import json
+import time
 from dataclasses import dataclass
+from pathlib import Path
+
+LOCATION_CACHE_FILE_NAME = "location.json"
+_LOCATION_CACHE_TTL_SECONDS = 7 * 24 * 3600.0
 
 
 @dataclass
@@ -11,7 +17,69 @@ class LocationContext:
     timezone_name: str | None = None
 
 
+def _location_cache_path() -> Path:
+    from .config_store import get_default_config_path
+
+    return get_default_config_path().parent / LOCATION_CACHE_FILE_NAME
+
+
+def _load_cached_location() -> LocationContext | None:
+    try:
+        raw_data = json.loads(_location_cache_path().read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return None
+    if not isinstance(raw_data, dict):
+        return None
+
+    try:
+        fetched_at = float(raw_data["fetched_at"])
+        latitude = float(raw_data["latitude"])
+        longitude = float(raw_data["longitude"])
+    except (KeyError, TypeError, ValueError):
+        return None
+    if time.time() - fetched_at >= _LOCATION_CACHE_TTL_SECONDS:
+        return None
+
+    timezone_name = raw_data.get("timezone_name")
+    return LocationContext(
+        latitude=latitude,
+        longitude=longitude,
+        region=str(raw_data.get("region") or "Location unavailable"),
+        timezone_name=str(timezone_name) if timezone_name else None,
+    )
+
+
+def _store_cached_location(context: LocationContext) -> None:
+    payload = {
+        "fetched_at": time.time(),
+        "latitude": context.latitude,
+        "longitude": context.longitude,
+        "region": context.region,
+        "timezone_name": context.timezone_name,
+    }
+    cache_path = _location_cache_path()
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(json.dumps(payload), encoding="utf-8")
+    except OSError:
+        pass
+
+
+def invalidate_location() -> None:
+    """Drop the cached IP-geolocation fix, forcing a fresh lookup."""
+    try:
+        _location_cache_path().unlink(missing_ok=True)
+    except OSError:
+        pass
+
+
 def detect_location_context_from_ip() -> LocationContext | None:
+    # IP geolocation moves slowly and the lookup blocks on HTTPS, so a fix
+    # under a week old is served from disk without touching the network.
+    cached = _load_cached_location()
+    if cached is not None:
+        return cached
+
     try:
         import geocoder
     except Exception:
@@ -64,12 +132,14 @@ def detect_location_context_from_ip() -> LocationContext | None:
     )
     region = _build_region_label(city, state, country)
 
-    return LocationContext(
+    context = LocationContext(
         latitude=latitude,
         longitude=longitude,
         region=region,
         timezone_name=timezone_name,
     )
+    _store_cached_location(context)
+    return context
 
 
 def detect_location_from_ip() -> tuple[float, float] | None:
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Literal
+from typing import ClassVar, Literal
 
 
 AnchorType = Literal["sunrise", "sunset", "time"]
@@ -9,7 +9,15 @@ RuleTarget = Literal["display1", "display2", "both"]
 
 
 def clamp_brightness(value: int | float) -> int:
-    return max(0, min(100, int(round(value))))
+    # int(value + 0.5) rounds without boxing a float through round(); any
+    # negative input clamps to 0 regardless of rounding direction.
+    bounded = int(value + 0.5)
+    return 0 if bounded < 0 else 100 if bounded > 100 else bounded
+
+
+def clamp_brightness_int(value: int) -> int:
+    """Clamp an already-integer level, skipping the rounding step."""
+    return 0 if value < 0 else 100 if value > 100 else value
 
 
 @dataclass
@@ -20,6 +28,30 @@ class ScheduleRule:
     target: RuleTarget = "both"
     specific_time: str | None = None
 
+    _ANCHORS: ClassVar[frozenset[str]] = frozenset({"sunrise", "sunset", "time"})
+    _TARGETS: ClassVar[frozenset[str]] = frozenset({"display1", "display2", "both"})
+
+    def __post_init__(self) -> None:
+        # Normalizing here keeps the rule's invariants in one place; callers
+        # with untrusted input just filter the ValueError.
+        anchor = str(self.anchor).strip().lower()
+        if anchor not in self._ANCHORS:
+            raise ValueError(f"invalid schedule anchor: {self.anchor!r}")
+        self.anchor = anchor
+
+        target = str(self.target).strip().lower()
+        self.target = target if target in self._TARGETS else "both"
+
+        self.offset_minutes = max(-1440, min(1440, int(self.offset_minutes)))
+        self.brightness = clamp_brightness(self.brightness)
+
+        if anchor == "time":
+            if not self.specific_time:
+                raise ValueError("time rules require specific_time")
+            self.offset_minutes = 0
+        else:
+            self.specific_time = None
+
 
 def default_schedule_rules() -> list[ScheduleRule]:
     return [
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 import winreg
@@ -10,7 +11,10 @@ RUN_KEY_PATH = r"Software\Microsoft\Windows\CurrentVersion\Run"
 RUN_VALUE_NAME = "BrightnessTrayScheduler"
 
 
+@lru_cache(maxsize=1)
 def build_startup_command() -> str:
+    # Path.resolve walks symlinks on every call, and the interpreter and
+    # script paths cannot change at runtime, so the command is built once.
     if getattr(sys, "frozen", False):
         return f"\"{Path(sys.executable).resolve()}\""
 
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
-from datetime import datetime, time, timedelta
+import re
+from bisect import bisect_right
+from datetime import date, datetime, time, timedelta
+from functools import lru_cache
 from typing import Any
 from zoneinfo import ZoneInfo
 
@@ -11,15 +14,51 @@ from tzlocal import get_localzone_name
 from .models import ScheduleRule, ScheduleSettings, clamp_brightness
 
 
+_TIME_RE = re.compile(r"([01]?\d|2[0-3]):([0-5]\d)")
+
+
+@lru_cache(maxsize=16)
+def _compute_sun_events(
+    date_ordinal: int, latitude: float, longitude: float, timezone_name: str
+) -> tuple[float, float] | None:
+    """Sunrise/sunset as POSIX timestamps for one day at one location.
+
+    The astral math never changes for a given (day, location), so repeated
+    timer polls collapse into this cache; timestamps keep the cached value
+    timezone-agnostic and cheap to store.
+    """
+    location = LocationInfo(
+        name="Local",
+        region="Local",
+        timezone=timezone_name,
+        latitude=latitude,
+        longitude=longitude,
+    )
+    try:
+        sun_times = sun(location.observer, date=date.fromordinal(date_ordinal))
+    except Exception:
+        return None
+
+    sunrise = sun_times.get("sunrise")
+    sunset = sun_times.get("sunset")
+    if sunrise is None or sunset is None:
+        return None
+    return (sunrise.timestamp(), sunset.timestamp())
+
+
 class SunScheduleEngine:
     def __init__(self) -> None:
         self.timezone_name = get_localzone_name()
+        # ZoneInfo construction hits the tzdata files; the local zone never
+        # changes for the lifetime of the engine, so build it once.
+        self._timezone = ZoneInfo(self.timezone_name)
 
     def target_brightness(
         self,
         schedule: ScheduleSettings,
         rules: list[ScheduleRule] | None = None,
         now: datetime | None = None,
+        uses_sun_events: bool | None = None,
     ) -> int | None:
         if not schedule.enabled:
             return None
@@ -27,11 +66,16 @@ class SunScheduleEngine:
         if not active_rules:
             return None
 
-        uses_sun_events = any(rule.anchor in ("sunrise", "sunset") for rule in active_rules)
+        # Callers that rebuild rule lists only on settings changes can pass
+        # the precomputed flag and skip this per-call scan.
+        if uses_sun_events is None:
+            uses_sun_events = any(
+                rule.anchor in ("sunrise", "sunset") for rule in active_rules
+            )
         if uses_sun_events and (schedule.latitude is None or schedule.longitude is None):
             return None
 
-        timezone = ZoneInfo(self.timezone_name)
+        timezone = self._timezone
         if now is None:
             current_time = datetime.now(timezone)
         elif now.tzinfo is None:
@@ -39,108 +83,140 @@ class SunScheduleEngine:
         else:
             current_time = now.astimezone(timezone)
 
-        points: list[tuple[datetime, int]] = []
-        for day_offset in (-1, 0, 1):
-            target_date = (current_time + timedelta(days=day_offset)).date()
-            sun_events: dict[str, datetime] | None = None
-            if uses_sun_events:
-                if schedule.latitude is None or schedule.longitude is None:
-                    continue
-                sun_events = self._get_sun_events(
-                    target_date, schedule.latitude, schedule.longitude, timezone
-                )
-
-            for rule in active_rules:
-                if rule.anchor == "time":
-                    parsed_time = self._parse_time(rule.specific_time)
-                    if parsed_time is None:
-                        continue
-                    anchor_time = datetime.combine(target_date, parsed_time, timezone)
-                else:
-                    if not sun_events:
-                        continue
-                    anchor_time = sun_events.get(rule.anchor)
-                    if anchor_time is None:
-                        continue
-                    anchor_time = anchor_time + timedelta(minutes=rule.offset_minutes)
-                points.append(
-                    (
-                        anchor_time,
-                        clamp_brightness(rule.brightness),
-                    )
-                )
+        # Parse each time rule once up front; the anchors repeat identically
+        # for every day we end up inspecting.
+        prepared_rules: list[tuple[ScheduleRule, time | None]] = [
+            (
+                rule,
+                self._parse_time(rule.specific_time) if rule.anchor == "time" else None,
+            )
+            for rule in active_rules
+        ]
+
+        # The schedule repeats daily, so only today's anchors need building.
+        # Adjacent days matter solely when the current time falls before
+        # today's first anchor or after its last one, and then only the
+        # single bracketing point is computed.
+        current_ts = int(current_time.timestamp())
+        todays = self._points_for_day(
+            current_time, 0, prepared_rules, schedule, timezone, uses_sun_events
+        )
 
-        if not points:
+        previous: tuple[int, int] | None = None
+        following: tuple[int, int] | None = None
+        if todays:
+            index = bisect_right([point[0] for point in todays], current_ts)
+            if index > 0:
+                previous = todays[index - 1]
+            if index < len(todays):
+                following = todays[index]
+
+        if previous is None:
+            yesterdays = self._points_for_day(
+                current_time, -1, prepared_rules, schedule, timezone, uses_sun_events
+            )
+            if yesterdays:
+                previous = yesterdays[-1]
+        if following is None:
+            tomorrows = self._points_for_day(
+                current_time, 1, prepared_rules, schedule, timezone, uses_sun_events
+            )
+            if tomorrows:
+                following = tomorrows[0]
+
+        if previous is None and following is None:
             return None
+        if previous is None:
+            previous = following
+        if following is None:
+            following = previous
 
-        points.sort(key=lambda point: point[0])
-        previous = points[0]
-        following = points[-1]
-        for point in points:
-            if point[0] <= current_time:
-                previous = point
-                continue
-            following = point
-            break
-
-        if not schedule.gradual:
+        # A single-point schedule has nothing to ramp between.
+        if not schedule.gradual or following is previous:
             return previous[1]
 
-        return self._interpolate(current_time, previous, following)
+        return self._interpolate(current_ts, previous, following)
+
+    def _points_for_day(
+        self,
+        current_time: datetime,
+        day_offset: int,
+        prepared_rules: list[tuple[ScheduleRule, time | None]],
+        schedule: ScheduleSettings,
+        timezone: ZoneInfo,
+        uses_sun_events: bool,
+    ) -> list[tuple[int, int]]:
+        # Anchors are kept as integer POSIX seconds so the bisect keys and
+        # the interpolation below stay pure arithmetic, with no datetime
+        # objects on the per-tick path.
+        target_date = (current_time + timedelta(days=day_offset)).date()
+        sun_events: dict[str, float] | None = None
+        if uses_sun_events and schedule.latitude is not None and schedule.longitude is not None:
+            sun_events = self._get_sun_events(
+                target_date, schedule.latitude, schedule.longitude
+            )
+
+        points: list[tuple[int, int]] = []
+        for rule, parsed_time in prepared_rules:
+            if rule.anchor == "time":
+                if parsed_time is None:
+                    continue
+                anchor_ts = int(
+                    datetime.combine(target_date, parsed_time, timezone).timestamp()
+                )
+            else:
+                if not sun_events:
+                    continue
+                event_ts = sun_events.get(rule.anchor)
+                if event_ts is None:
+                    continue
+                anchor_ts = int(event_ts) + rule.offset_minutes * 60
+            points.append((anchor_ts, clamp_brightness(rule.brightness)))
+
+        points.sort(key=lambda point: point[0])
+        return points
 
     def _get_sun_events(
-        self, target_date: Any, latitude: float, longitude: float, timezone: ZoneInfo
-    ) -> dict[str, datetime] | None:
-        location = LocationInfo(
-            name="Local",
-            region="Local",
-            timezone=self.timezone_name,
-            latitude=latitude,
-            longitude=longitude,
+        self, target_date: Any, latitude: float, longitude: float
+    ) -> dict[str, float] | None:
+        events = _compute_sun_events(
+            target_date.toordinal(),
+            round(latitude, 4),
+            round(longitude, 4),
+            self.timezone_name,
         )
-        try:
-            sun_times = sun(location.observer, date=target_date, tzinfo=timezone)
-        except Exception:
-            return None
-
-        sunrise = sun_times.get("sunrise")
-        sunset = sun_times.get("sunset")
-        if sunrise is None or sunset is None:
+        if events is None:
             return None
-        return {"sunrise": sunrise, "sunset": sunset}
+        sunrise_ts, sunset_ts = events
+        return {"sunrise": sunrise_ts, "sunset": sunset_ts}
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def _parse_time(value: str | None) -> time | None:
+        # Rule times are a tiny, stable vocabulary ("07:30", "21:00", ...);
+        # the cache means each distinct string is validated exactly once.
         if not value:
             return None
-        text = value.strip()
-        if ":" not in text:
-            return None
-        parts = text.split(":", 1)
-        if len(parts) != 2:
+        match = _TIME_RE.fullmatch(value.strip())
+        if match is None:
             return None
-        try:
-            hour = int(parts[0])
-            minute = int(parts[1])
-        except (TypeError, ValueError):
-            return None
-        if hour < 0 or hour > 23 or minute < 0 or minute > 59:
-            return None
-        return time(hour=hour, minute=minute)
+        return time(hour=int(match.group(1)), minute=int(match.group(2)))
 
     @staticmethod
     def _interpolate(
-        current_time: datetime,
-        previous: tuple[datetime, int],
-        following: tuple[datetime, int],
+        current_ts: int,
+        previous: tuple[int, int],
+        following: tuple[int, int],
     ) -> int:
-        start_time, start_value = previous
-        end_time, end_value = following
-        if end_time <= start_time:
+        start_ts, start_value = previous
+        end_ts, end_value = following
+        # Adjacent rules at the same level form a plateau; skip the ratio math.
+        if start_value == end_value:
+            return clamp_brightness(start_value)
+        if end_ts <= start_ts:
             return clamp_brightness(end_value)
 
-        elapsed_seconds = (current_time - start_time).total_seconds()
-        duration_seconds = (end_time - start_time).total_seconds()
-        ratio = max(0.0, min(1.0, elapsed_seconds / duration_seconds))
+        ratio = (current_ts - start_ts) / (end_ts - start_ts)
+        ratio = max(0.0, min(1.0, ratio))
         blended = start_value + (end_value - start_value) * ratio
         return clamp_brightness(blended)
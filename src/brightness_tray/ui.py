@@ -1,23 +1,42 @@
 from __future__ import annotations
 
-from copy import deepcopy
+from collections import OrderedDict
+from dataclasses import replace as dataclass_replace
 from datetime import datetime
+from functools import lru_cache, partial
 import math
+import os
 from pathlib import Path
 import sys
 import time as wall_time
 from zoneinfo import ZoneInfo
 
-from PySide6.QtCore import QPoint, QPointF, QRegularExpression, QSize, QTimer, Qt, Signal
+from PySide6.QtCore import (
+    QEvent,
+    QObject,
+    QPoint,
+    QPointF,
+    QRect,
+    QRegularExpression,
+    QRunnable,
+    QSize,
+    QThreadPool,
+    QTimer,
+    Qt,
+    Signal,
+)
 from PySide6.QtGui import (
     QColor,
     QCursor,
     QGuiApplication,
     QIcon,
     QPainter,
+    QPalette,
     QPen,
     QPixmap,
     QRegularExpressionValidator,
+    QStandardItem,
+    QStandardItemModel,
 )
 from PySide6.QtWidgets import (
     QAbstractItemView,
@@ -27,7 +46,6 @@ from PySide6.QtWidgets import (
     QComboBox,
     QDialog,
     QDialogButtonBox,
-    QGraphicsOpacityEffect,
     QGroupBox,
     QHBoxLayout,
     QHeaderView,
@@ -45,10 +63,6 @@ from PySide6.QtWidgets import (
     QVBoxLayout,
     QWidget,
 )
-from astral import LocationInfo
-from astral.sun import sun
-from tzlocal import get_localzone_name
-
 from .ambient_light import AmbientLightService
 from .brightness_service import BrightnessService, MonitorHandle, PictureControl
 from .config_store import ConfigStore
@@ -63,26 +77,33 @@ from .themes import (
     normalize_theme_name,
 )
 
-def _resolve_icon_path(filename: str) -> Path | None:
-    module_dir = Path(__file__).resolve().parent
-    candidate_paths = [
-        module_dir / "assets" / "icons" / filename,
-    ]
-
-    meipass = getattr(sys, "_MEIPASS", None)
-    if meipass:
-        pyinstaller_root = Path(meipass)
-        # Support both legacy and corrected PyInstaller data targets.
-        candidate_paths.extend(
-            [
-                pyinstaller_root / "src" / "brightness_tray" / "assets" / "icons" / filename,
-                pyinstaller_root / "brightness_tray" / "assets" / "icons" / filename,
-            ]
-        )
+# Resolved once at import: Path.resolve() stats every path component, and
+# neither the module location nor the PyInstaller bundle root can change at
+# runtime.
+_ICON_DIRS: tuple[Path, ...] = (Path(__file__).resolve().parent / "assets" / "icons",)
+_MEIPASS = getattr(sys, "_MEIPASS", None)
+if _MEIPASS:
+    # Support both legacy and corrected PyInstaller data targets.
+    _ICON_DIRS += (
+        Path(_MEIPASS) / "src" / "brightness_tray" / "assets" / "icons",
+        Path(_MEIPASS) / "brightness_tray" / "assets" / "icons",
+    )
 
-    for candidate in candidate_paths:
-        if candidate.exists():
-            return candidate
+# One scandir per directory at import instead of one stat per candidate per
+# lookup; the bundled icon set cannot change while the app runs.
+_ICON_INDEX: dict[Path, frozenset[str]] = {}
+for _icon_dir in _ICON_DIRS:
+    try:
+        _ICON_INDEX[_icon_dir] = frozenset(entry.name for entry in os.scandir(_icon_dir))
+    except OSError:
+        _ICON_INDEX[_icon_dir] = frozenset()
+
+
+@lru_cache(maxsize=None)
+def _resolve_icon_path(filename: str) -> Path | None:
+    for icon_dir, names in _ICON_INDEX.items():
+        if filename in names:
+            return icon_dir / filename
     return None
 
 
@@ -92,17 +113,22 @@ POPUP_EDGE_MARGIN_PX = 10
 POPUP_TASKBAR_CLEARANCE_PX = 8
 
 
-def _bottom_right_popup_position(widget: QWidget, available) -> QPoint:
-    frame = widget.frameGeometry()
-    desired_x = available.right() - frame.width() - POPUP_EDGE_MARGIN_PX + 1
+def _bottom_right_popup_position(widget: QWidget, available, size: QSize | None = None) -> QPoint:
+    # Callers that already know the size they are about to apply pass it
+    # explicitly, so position and resize can land in one setGeometry call;
+    # these popups are frameless, making the client size the frame size.
+    if size is None:
+        frame = widget.frameGeometry()
+        size = frame.size()
+    desired_x = available.right() - size.width() - POPUP_EDGE_MARGIN_PX + 1
     desired_y = (
         available.bottom()
-        - frame.height()
+        - size.height()
         - (POPUP_EDGE_MARGIN_PX + POPUP_TASKBAR_CLEARANCE_PX)
         + 1
     )
-    max_x = available.right() - frame.width() + 1
-    max_y = available.bottom() - frame.height() + 1
+    max_x = available.right() - size.width() + 1
+    max_y = available.bottom() - size.height() + 1
     target_x = max(available.left(), min(desired_x, max_x))
     target_y = available.top() if desired_y < available.top() else min(desired_y, max_y)
     return QPoint(target_x, target_y)
@@ -142,30 +168,147 @@ def _apply_rounded_popup_chrome(widget: QWidget, object_name: str) -> None:
     _apply_native_rounded_corners(widget)
 
 
-class MonitorSliderRow(QWidget):
-    brightness_changed = Signal(str, int)
+class _LocationContextWorkerSignals(QObject):
+    finished = Signal(object)
 
-    def __init__(self, monitor: MonitorHandle, initial_value: int, parent: QWidget | None = None):
+
+class _LocationContextWorker(QRunnable):
+    """Runs the blocking IP-geolocation lookup off the Qt main thread."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.signals = _LocationContextWorkerSignals()
+
+    def run(self) -> None:
+        try:
+            context = detect_location_context_from_ip()
+        except Exception:
+            context = None
+        self.signals.finished.emit(context)
+
+
+def _clone_config(config: AppConfig) -> AppConfig:
+    schedule = dataclass_replace(
+        config.schedule,
+        rules=[dataclass_replace(rule) for rule in config.schedule.rules],
+    )
+    return dataclass_replace(
+        config,
+        schedule=schedule,
+        monitor_levels=dict(config.monitor_levels),
+    )
+
+
+# Lux to brightness, precomputed over the sensor's useful integer range so
+# the ambient timer path is a bounds check and a byte lookup instead of two
+# log10 evaluations per sample.  Matches 6 + log10(lux+1)/log10(801) * 94.
+_LUX_TABLE_MAX = 10_000
+_LUX_TO_BRIGHTNESS = bytes(
+    clamp_brightness(6.0 + min(1.0, math.log10(lux + 1.0) / math.log10(801.0)) * 94.0)
+    for lux in range(_LUX_TABLE_MAX + 1)
+)
+
+
+# Compiled once; every rule row's time edit validates against the same
+# pattern, so each row shares this instead of recompiling it.
+_HHMM_REGEX = QRegularExpression(r"^([01]?\d|2[0-3]):[0-5]\d$")
+
+
+# Immutable templates for the preset sunrise/sunset ramp; callers that need
+# per-row copies take them from here instead of re-allocating eight rules on
+# every table scan.
+_DEFAULT_SUN_RAMP_RULES: tuple[ScheduleRule, ...] = (
+    ScheduleRule(anchor="sunrise", offset_minutes=0, brightness=0, target="both"),
+    ScheduleRule(anchor="sunrise", offset_minutes=15, brightness=10, target="both"),
+    ScheduleRule(anchor="sunrise", offset_minutes=40, brightness=50, target="both"),
+    ScheduleRule(anchor="sunrise", offset_minutes=60, brightness=100, target="both"),
+    ScheduleRule(anchor="sunset", offset_minutes=-40, brightness=100, target="both"),
+    ScheduleRule(anchor="sunset", offset_minutes=-15, brightness=50, target="both"),
+    ScheduleRule(anchor="sunset", offset_minutes=0, brightness=15, target="both"),
+    ScheduleRule(anchor="sunset", offset_minutes=30, brightness=0, target="both"),
+)
+
+# Primitive mirror of the templates above, built once at import.  The row
+# scan compares against these with tuple equality; interning the string
+# fields lets those comparisons short-circuit on identity.
+_DEFAULT_SUN_RAMP_TUPLES: tuple[tuple[str, str, int, int, str | None], ...] = tuple(
+    (
+        sys.intern(rule.target),
+        sys.intern(rule.anchor),
+        rule.offset_minutes,
+        clamp_brightness(rule.brightness),
+        rule.specific_time,
+    )
+    for rule in _DEFAULT_SUN_RAMP_RULES
+)
+
+
+class _TextSliderRow(QWidget):
+    """Slider row that paints its flanking texts directly.
+
+    Replaces the QLabel + QSlider + QLabel trio (plus their QHBoxLayout)
+    with one widget owning just the QSlider; the name and value texts are
+    drawn in paintEvent, so a value change repaints one small rect instead
+    of relayouting three child widgets.
+    """
+
+    _NAME_WIDTH = 120
+    _VALUE_WIDTH = 40
+    _SPACING = 8
+
+    def __init__(self, parent: QWidget | None = None):
         super().__init__(parent)
-        self.monitor = monitor
+        self._name_text = ""
+        self._value_text = ""
+        self.slider = QSlider(Qt.Orientation.Horizontal, self)
+
+    def sizeHint(self) -> QSize:
+        hint = self.slider.sizeHint()
+        return QSize(
+            self._NAME_WIDTH + self._VALUE_WIDTH + hint.width() + self._SPACING * 2,
+            hint.height(),
+        )
 
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(0, 0, 0, 0)
+    def minimumSizeHint(self) -> QSize:
+        return self.sizeHint()
 
-        self.name_label = QLabel(monitor.name)
-        self.name_label.setMinimumWidth(120)
-        layout.addWidget(self.name_label)
+    def resizeEvent(self, event) -> None:  # type: ignore[override]
+        super().resizeEvent(event)
+        slider_x = self._NAME_WIDTH + self._SPACING
+        slider_width = max(0, self.width() - slider_x - self._VALUE_WIDTH - self._SPACING)
+        self.slider.setGeometry(slider_x, 0, slider_width, self.height())
 
-        self.slider = QSlider(Qt.Orientation.Horizontal)
-        self.slider.setRange(0, 100)
-        self.slider.setValue(clamp_brightness(initial_value))
-        layout.addWidget(self.slider, stretch=1)
+    def _set_value_text(self, text: str) -> None:
+        if text == self._value_text:
+            return
+        self._value_text = text
+        self.update(self.width() - self._VALUE_WIDTH, 0, self._VALUE_WIDTH, self.height())
+
+    def paintEvent(self, event) -> None:  # type: ignore[override]
+        painter = QPainter(self)
+        painter.setPen(self.palette().color(QPalette.ColorRole.WindowText))
+        painter.drawText(
+            QRect(0, 0, self._NAME_WIDTH, self.height()),
+            Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+            self._name_text,
+        )
+        painter.drawText(
+            QRect(self.width() - self._VALUE_WIDTH, 0, self._VALUE_WIDTH, self.height()),
+            Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter,
+            self._value_text,
+        )
 
-        self.value_label = QLabel(f"{self.slider.value()}%")
-        self.value_label.setMinimumWidth(40)
-        self.value_label.setAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-        layout.addWidget(self.value_label)
 
+class MonitorSliderRow(_TextSliderRow):
+    brightness_changed = Signal(str, int)
+
+    def __init__(self, monitor: MonitorHandle, initial_value: int, parent: QWidget | None = None):
+        super().__init__(parent)
+        self.monitor = monitor
+        self._name_text = monitor.name
+        self.slider.setRange(0, 100)
+        self.slider.setValue(clamp_brightness(initial_value))
+        self._value_text = f"{self.slider.value()}%"
         self.slider.valueChanged.connect(self._handle_slider_change)
 
     def set_value(self, value: int) -> None:
@@ -173,44 +316,30 @@ class MonitorSliderRow(QWidget):
         self.slider.blockSignals(True)
         self.slider.setValue(bounded)
         self.slider.blockSignals(False)
-        self.value_label.setText(f"{bounded}%")
+        self._set_value_text(f"{bounded}%")
 
     def _handle_slider_change(self, value: int) -> None:
-        bounded = clamp_brightness(value)
-        self.value_label.setText(f"{bounded}%")
-        self.brightness_changed.emit(self.monitor.key, bounded)
+        # Qt guarantees valueChanged stays within the slider's range; this
+        # runs per mouse-move during a drag, so no re-clamp.
+        self._set_value_text(f"{value}%")
+        self.brightness_changed.emit(self.monitor.key, value)
 
 
-class PictureControlSliderRow(QWidget):
+class PictureControlSliderRow(_TextSliderRow):
     control_changed = Signal(int, int)
     _DRAG_EMIT_INTERVAL_MS = 180
+    _NAME_WIDTH = 190
+    _VALUE_WIDTH = 42
 
     def __init__(self, control: PictureControl, parent: QWidget | None = None):
         super().__init__(parent)
         self.control = control
         self._last_emitted_value = int(control.value)
         self._pending_drag_emit = False
-
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(0, 0, 0, 0)
-
-        self.name_label = QLabel(f"{control.name} (0x{control.code:02X})")
-        self.name_label.setMinimumWidth(190)
-        layout.addWidget(self.name_label)
-
-        self.slider = QSlider(Qt.Orientation.Horizontal)
+        self._name_text = f"{control.name} (0x{control.code:02X})"
         self.slider.setRange(control.minimum, control.maximum)
         self.slider.setValue(control.value)
-        layout.addWidget(self.slider, stretch=1)
-
-        self.value_label = QLabel(str(self.slider.value()))
-        self.value_label.setMinimumWidth(42)
-        self.value_label.setAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
-        layout.addWidget(self.value_label)
-
-        self._drag_apply_timer = QTimer(self)
-        self._drag_apply_timer.setInterval(self._DRAG_EMIT_INTERVAL_MS)
-        self._drag_apply_timer.timeout.connect(self._handle_drag_tick)
+        self._value_text = str(self.slider.value())
 
         self.slider.valueChanged.connect(self._handle_slider_change)
         self.slider.sliderReleased.connect(self._emit_committed_value)
@@ -220,46 +349,53 @@ class PictureControlSliderRow(QWidget):
         self.slider.blockSignals(True)
         self.slider.setValue(bounded)
         self.slider.blockSignals(False)
-        self.value_label.setText(str(bounded))
+        self._set_value_text(str(bounded))
         self._last_emitted_value = bounded
 
+    def rebind(self, control: PictureControl) -> None:
+        """Point a recycled row at a new control without rebuilding widgets."""
+        self.control = control
+        self._pending_drag_emit = False
+        self._name_text = f"{control.name} (0x{control.code:02X})"
+        self.slider.blockSignals(True)
+        self.slider.setRange(control.minimum, control.maximum)
+        self.slider.setValue(control.value)
+        self.slider.blockSignals(False)
+        bounded = self.slider.value()
+        self._value_text = str(bounded)
+        self._last_emitted_value = bounded
+        self.update()
+
     def _handle_slider_change(self, value: int) -> None:
-        bounded = max(self.slider.minimum(), min(self.slider.maximum(), int(value)))
-        self.value_label.setText(str(bounded))
+        # valueChanged is already bounded to the slider's range.
+        self._set_value_text(str(value))
         if self.slider.isSliderDown():
+            # Drag throttling runs on one dialog-level timer shared by all
+            # rows rather than a QTimer per slider.
             self._pending_drag_emit = True
-            if not self._drag_apply_timer.isActive():
-                self._drag_apply_timer.start()
+            register = getattr(self.window(), "_register_pending_drag", None)
+            if register is not None:
+                register(self)
             return
 
         self._pending_drag_emit = False
-        if self._drag_apply_timer.isActive():
-            self._drag_apply_timer.stop()
-        self._emit_if_changed(bounded)
+        self._emit_if_changed(value)
 
     def _handle_drag_tick(self) -> None:
-        if not self.slider.isSliderDown():
-            self._drag_apply_timer.stop()
-            return
         if not self._pending_drag_emit:
             return
         self._pending_drag_emit = False
-        current_value = max(self.slider.minimum(), min(self.slider.maximum(), self.slider.value()))
-        self._emit_if_changed(current_value)
+        self._emit_if_changed(self.slider.value())
 
     def _emit_committed_value(self) -> None:
         self._pending_drag_emit = False
-        if self._drag_apply_timer.isActive():
-            self._drag_apply_timer.stop()
-        value = max(self.slider.minimum(), min(self.slider.maximum(), self.slider.value()))
-        self._emit_if_changed(value)
+        self._emit_if_changed(self.slider.value())
 
     def _emit_if_changed(self, value: int) -> None:
-        bounded = max(self.slider.minimum(), min(self.slider.maximum(), int(value)))
-        if bounded == self._last_emitted_value:
+        if value == self._last_emitted_value:
             return
-        self._last_emitted_value = bounded
-        self.control_changed.emit(self.control.code, bounded)
+        self._last_emitted_value = value
+        self.control_changed.emit(self.control.code, value)
 
 
 class PictureControlsDialog(QDialog):
@@ -313,6 +449,26 @@ class PictureControlsDialog(QDialog):
         footer_layout.addWidget(self.close_button)
         root_layout.addLayout(footer_layout)
 
+        self._available_geometry_cache = None
+        self._screen_signal_connected = False
+        self._geometry_signal_screen = None
+        self._cached_static_height: int | None = None
+
+        # Zero-interval single-shot: bursts of size invalidations collapse
+        # into one relayout per event-loop turn.
+        self._refresh_size_timer = QTimer(self)
+        self._refresh_size_timer.setSingleShot(True)
+        self._refresh_size_timer.setInterval(0)
+        self._refresh_size_timer.timeout.connect(self._refresh_dialog_size_now)
+
+        # One drag-throttle timer for every slider row; it only runs while
+        # at least one slider is held down.
+        self._pending_drag_rows: set[PictureControlSliderRow] = set()
+        self._row_pool: list[PictureControlSliderRow] = []
+        self._drag_apply_timer = QTimer(self)
+        self._drag_apply_timer.setInterval(PictureControlSliderRow._DRAG_EMIT_INTERVAL_MS)
+        self._drag_apply_timer.timeout.connect(self._handle_drag_timer_tick)
+
         self.refresh_button.clicked.connect(
             lambda _checked=False: self._reload_controls(force_refresh=True)
         )
@@ -330,19 +486,39 @@ class PictureControlsDialog(QDialog):
         return max(320, available.height() - 36)
 
     def _refresh_dialog_size(self) -> None:
-        self.content_widget.adjustSize()
-        layout = self.layout()
-        if layout is None:
+        # Pre-show calls are wasted work: showEvent schedules one relayout
+        # once the dialog is mapped.
+        if not self.isVisible():
             return
+        self._refresh_size_timer.start()
+
+    def _static_chrome_height(self) -> int:
+        # Toolbar and footer hints are fixed unless the status text rewraps,
+        # so the sizeHint round trips run once per status change.
+        if self._cached_static_height is not None:
+            return self._cached_static_height
+        layout = self.layout()
         margins = layout.contentsMargins()
         spacing = max(0, layout.spacing())
-        static_height = (
+        self._cached_static_height = (
             margins.top()
             + margins.bottom()
             + self.refresh_button.sizeHint().height()
             + max(self.status_label.sizeHint().height(), self.close_button.sizeHint().height())
             + (spacing * 2)
         )
+        return self._cached_static_height
+
+    def _set_status(self, text: str) -> None:
+        if text == self.status_label.text():
+            return
+        self.status_label.setText(text)
+        self._cached_static_height = None
+
+    def _refresh_dialog_size_now(self) -> None:
+        if self.layout() is None:
+            return
+        static_height = self._static_chrome_height()
         preferred_content = self._content_table_height()
         max_height = self._max_dialog_height()
         max_content_height = max(1, max_height - static_height)
@@ -355,11 +531,26 @@ class PictureControlsDialog(QDialog):
         )
 
         target_width = max(self.minimumWidth(), self.sizeHint().width())
-        self.resize(target_width, static_height + content_height)
+        target_height = static_height + content_height
+        # One setGeometry instead of resize-then-move: Qt walks a single
+        # geometry change and paint invalidation per pass.
         if self.isVisible():
-            self._position_bottom_right()
+            available = self._available_geometry()
+            if available is not None:
+                target = _bottom_right_popup_position(
+                    self, available, QSize(target_width, target_height)
+                )
+                self.setGeometry(target.x(), target.y(), target_width, target_height)
+                return
+        if (target_width, target_height) != (self.width(), self.height()):
+            self.resize(target_width, target_height)
 
     def _available_geometry(self):
+        # The work-area rect only changes when the dialog lands on another
+        # screen or that screen's geometry shifts, so the screen/parent/
+        # primary walk runs once per (screen, work area).
+        if self._available_geometry_cache is not None:
+            return self._available_geometry_cache
         screen = self.screen()
         if screen is None and self.parentWidget() is not None:
             screen = self.parentWidget().screen()
@@ -367,7 +558,28 @@ class PictureControlsDialog(QDialog):
             screen = QGuiApplication.primaryScreen()
         if screen is None:
             return None
-        return screen.availableGeometry()
+        self._available_geometry_cache = screen.availableGeometry()
+        self._track_screen_geometry(screen)
+        return self._available_geometry_cache
+
+    def _track_screen_geometry(self, screen) -> None:
+        # Resolution changes and taskbar moves reshape the work area without
+        # the dialog changing screens, so the resolved screen's geometry
+        # signal invalidates the cache too; reconnected when the dialog lands
+        # on a different screen.
+        if screen is self._geometry_signal_screen:
+            return
+        previous = self._geometry_signal_screen
+        if previous is not None:
+            try:
+                previous.availableGeometryChanged.disconnect(self._handle_screen_changed)
+            except (RuntimeError, TypeError):
+                pass
+        screen.availableGeometryChanged.connect(self._handle_screen_changed)
+        self._geometry_signal_screen = screen
+
+    def _handle_screen_changed(self, _screen=None) -> None:
+        self._available_geometry_cache = None
 
     def _position_bottom_right(self) -> None:
         available = self._available_geometry()
@@ -378,23 +590,69 @@ class PictureControlsDialog(QDialog):
     def showEvent(self, event) -> None:  # type: ignore[override]
         super().showEvent(event)
         _apply_native_rounded_corners(self)
-        QTimer.singleShot(0, self._refresh_dialog_size)
+        window_handle = self.windowHandle()
+        if window_handle is not None and not self._screen_signal_connected:
+            window_handle.screenChanged.connect(self._handle_screen_changed)
+            self._screen_signal_connected = True
+        self._refresh_dialog_size()
+
+    def _register_pending_drag(self, row: PictureControlSliderRow) -> None:
+        self._pending_drag_rows.add(row)
+        if not self._drag_apply_timer.isActive():
+            self._drag_apply_timer.start()
+
+    def _handle_drag_timer_tick(self) -> None:
+        released = [
+            row for row in self._pending_drag_rows if not row.slider.isSliderDown()
+        ]
+        for row in self._pending_drag_rows:
+            row._handle_drag_tick()
+        for row in released:
+            self._pending_drag_rows.discard(row)
+        if not self._pending_drag_rows:
+            self._drag_apply_timer.stop()
 
     def _clear_content(self) -> None:
-        while self.content_layout.count():
-            item = self.content_layout.takeAt(0)
-            widget = item.widget()
-            if widget is not None:
-                widget.deleteLater()
+        self._pending_drag_rows.clear()
+        self._drag_apply_timer.stop()
+        # Recycle slider rows instead of destroying them; building the row
+        # widgets dominates the cost of a reload.
+        for row in self.content_widget.findChildren(PictureControlSliderRow):
+            try:
+                row.control_changed.disconnect()
+            except (RuntimeError, TypeError):
+                pass
+            row.hide()
+            row.setParent(None)
+            self._row_pool.append(row)
+
+        # Swap in a fresh content widget and tear the old subtree down with
+        # one deleteLater, rather than takeAt(0)-shifting the layout list
+        # and posting a delete event per group.
+        old_widget = self.content_scroll.takeWidget()
+        if old_widget is not None:
+            old_widget.deleteLater()
+        self.content_widget = QWidget()
+        self.content_layout = QVBoxLayout(self.content_widget)
+        self.content_layout.setContentsMargins(0, 0, 0, 0)
+        self.content_layout.setSpacing(10)
+        self.content_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
+        self.content_scroll.setWidget(self.content_widget)
 
     def _reload_controls(self, force_refresh: bool) -> None:
         self._clear_content()
 
         if not self.monitors:
-            self.status_label.setText("No monitors are currently available.")
+            self._set_status("No monitors are currently available.")
             return
 
         monitor_count_with_controls = 0
+        # One concurrent probe for all monitors; per-display DDC sleeps
+        # overlap instead of serializing.
+        controls_by_key = self.service.list_picture_controls_all(
+            use_cache=not force_refresh,
+            include_capabilities=force_refresh,
+        )
         for monitor in self.monitors:
             group = QGroupBox(monitor.name)
             group.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Maximum)
@@ -402,18 +660,7 @@ class PictureControlsDialog(QDialog):
             group_layout.setContentsMargins(8, 4, 8, 8)
             group_layout.setSpacing(8)
 
-            try:
-                controls = self.service.list_picture_controls(
-                    monitor,
-                    use_cache=not force_refresh,
-                    include_capabilities=force_refresh,
-                )
-            except Exception as error:
-                controls = []
-                failure_label = QLabel(f"Could not read controls: {error}")
-                failure_label.setWordWrap(True)
-                group_layout.addWidget(failure_label)
-
+            controls = controls_by_key.get(monitor.key, [])
             if not controls:
                 unsupported_label = QLabel(
                     "No supported picture controls were reported by this display."
@@ -423,26 +670,29 @@ class PictureControlsDialog(QDialog):
             else:
                 monitor_count_with_controls += 1
                 for control in controls:
-                    row = PictureControlSliderRow(control, parent=group)
+                    if self._row_pool:
+                        row = self._row_pool.pop()
+                        row.setParent(group)
+                        row.rebind(control)
+                        row.show()
+                    else:
+                        row = PictureControlSliderRow(control, parent=group)
+                    # partial instead of a lambda: one fewer Python frame
+                    # per emission on the drag path.
                     row.control_changed.connect(
-                        lambda code, value, monitor_ref=monitor, row_ref=row: self._apply_control_value(
-                            monitor_ref,
-                            row_ref,
-                            code,
-                            value,
-                        )
+                        partial(self._apply_control_value, monitor, row)
                     )
                     group_layout.addWidget(row)
 
             self.content_layout.addWidget(group)
 
         if monitor_count_with_controls == 0:
-            self.status_label.setText(
+            self._set_status(
                 "No picture sliders are available. "
                 "Verify DDC/CI is enabled in the monitor OSD."
             )
         else:
-            self.status_label.setText(
+            self._set_status(
                 f"Loaded picture controls for {monitor_count_with_controls} of "
                 f"{len(self.monitors)} monitor(s)."
             )
@@ -459,7 +709,7 @@ class PictureControlsDialog(QDialog):
         if success:
             return
 
-        self.status_label.setText(
+        self._set_status(
             f"{monitor.name}: could not update {row.control.name}."
         )
 
@@ -479,7 +729,9 @@ class SettingsDialog(QDialog):
         self.setMinimumWidth(760)
         _apply_rounded_popup_chrome(self, "settingsDialog")
 
-        self._source_config = deepcopy(current_config)
+        # Only schedule.rules and monitor_levels are mutable; a one-level
+        # clone avoids deepcopy's per-field reduce recursion over the config.
+        self._source_config = _clone_config(current_config)
         self._initial_theme = normalize_theme_name(current_config.theme)
         self._selected_theme = self._initial_theme
         self.updated_config: AppConfig | None = None
@@ -488,7 +740,40 @@ class SettingsDialog(QDialog):
         self.monitor_handles = monitor_handles or []
         self._detected_location: LocationContext | None = None
         self._location_timezone_name: str | None = None
-        self._sun_times_cache_key: tuple[str, float, float, str] | None = None
+        self._location_fetch_inflight = False
+        self._bulk_add_in_progress = False
+        self._sun_times_cache_key: tuple[int, int, int, str] | None = None
+        # Formatted sunrise/sunset strings for recent (day, location, zone)
+        # keys; lets a location toggle flip back without redoing the solar
+        # math.  Tiny LRU, oldest entry dropped past eight keys.
+        self._sun_times_memo: OrderedDict[tuple[int, int, int, str], tuple[str, str]] = (
+            OrderedDict()
+        )
+        self._cached_zoneinfo: tuple[str | None, ZoneInfo | None] = (None, None)
+        self._available_geometry_cache = None
+        self._screen_signal_connected = False
+        self._geometry_signal_screen = None
+
+        # Same coalescing single-shot as PictureControlsDialog.
+        self._refresh_size_timer = QTimer(self)
+        self._refresh_size_timer.setSingleShot(True)
+        self._refresh_size_timer.setInterval(0)
+        self._refresh_size_timer.timeout.connect(self._refresh_dialog_size_now)
+
+        self._default_rules_state_timer = QTimer(self)
+        self._default_rules_state_timer.setSingleShot(True)
+        self._default_rules_state_timer.setInterval(0)
+        self._default_rules_state_timer.timeout.connect(
+            self._refresh_default_rules_button_state_now
+        )
+
+        # One validator QObject serves every rule row's time edit;
+        # QLineEdit.setValidator does not take ownership, so sharing is safe.
+        self._hhmm_validator = QRegularExpressionValidator(_HHMM_REGEX, self)
+
+        # Constant for a given style; re-read only on a style change instead
+        # of crossing into the style system on every size refresh.
+        self._scrollbar_extent = self.style().pixelMetric(QStyle.PixelMetric.PM_ScrollBarExtent)
 
         root_layout = QVBoxLayout(self)
         self.content_scroll = QScrollArea()
@@ -620,11 +905,27 @@ class SettingsDialog(QDialog):
             }
             """
         )
+        # Interactive instead of ResizeToContents: the auto mode re-scans
+        # every column on each insert, so row fills call
+        # resizeColumnsToContents() once when they finish instead.
         self.rules_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
-        self.rules_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.ResizeToContents)
-        self.rules_table.horizontalHeader().setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)
-        self.rules_table.horizontalHeader().setSectionResizeMode(3, QHeaderView.ResizeMode.ResizeToContents)
-        self.rules_table.horizontalHeader().setSectionResizeMode(4, QHeaderView.ResizeMode.ResizeToContents)
+        self.rules_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.Interactive)
+        self.rules_table.horizontalHeader().setSectionResizeMode(2, QHeaderView.ResizeMode.Interactive)
+        self.rules_table.horizontalHeader().setSectionResizeMode(3, QHeaderView.ResizeMode.Interactive)
+        self.rules_table.horizontalHeader().setSectionResizeMode(4, QHeaderView.ResizeMode.Interactive)
+        # Every row holds the same mix of combo/line-edit/spin editors, so
+        # all rows share one measured height and the per-row
+        # resizeRowsToContents() scan in the size refresh is unnecessary.
+        self._rules_row_height = (
+            max(
+                QComboBox().sizeHint().height(),
+                QLineEdit().sizeHint().height(),
+                QSpinBox().sizeHint().height(),
+            )
+            + 4
+        )
+        self.rules_table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.rules_table.verticalHeader().setDefaultSectionSize(self._rules_row_height)
         schedule_layout.addWidget(self.rules_table)
 
         self.rule_buttons_widget = QWidget()
@@ -658,16 +959,29 @@ class SettingsDialog(QDialog):
         root_layout.addWidget(button_box)
         self.button_box = button_box
 
+        # One model for every row's target combo; the three display choices
+        # are identical across rows, so per-combo item lists are wasted.
+        self._target_model = QStandardItemModel(self)
+        for value, label in self._build_target_choices():
+            item = QStandardItem(label)
+            item.setData(value, Qt.ItemDataRole.UserRole)
+            self._target_model.appendRow(item)
+        self._anchor_model = QStandardItemModel(self)
+        for anchor_label in ("sunrise", "sunset", "specific time"):
+            self._anchor_model.appendRow(QStandardItem(anchor_label))
+
         self.picture_controls_button.clicked.connect(
             lambda _checked=False: self._open_picture_controls_dialog()
         )
         self.schedule_enabled_checkbox.toggled.connect(self._handle_schedule_enabled_toggled)
         self._load_from_config()
+        # The clock label only shows HH:MM, so instead of a 1 Hz tick the
+        # timer single-shots just past each minute boundary, and only while
+        # the dialog is visible.
         self._clock_timer = QTimer(self)
-        self._clock_timer.setInterval(1_000)
-        self._clock_timer.timeout.connect(self._update_location_time_label)
-        self._clock_timer.start()
-        QTimer.singleShot(0, self._refresh_dialog_size)
+        self._clock_timer.setSingleShot(True)
+        self._clock_timer.timeout.connect(self._handle_clock_tick)
+        self._refresh_dialog_size()
 
     def _build_target_choices(self) -> list[tuple[str, str]]:
         device_name = BrightnessService.system_device_name()
@@ -716,8 +1030,17 @@ class SettingsDialog(QDialog):
         self._refresh_auto_location(refresh_detection=True)
 
         rules = self._source_config.schedule.rules or default_schedule_rules()
-        for rule in rules:
-            self._add_rule_row(rule)
+        # Bulk fill with repaints and signals off; each cell-widget insert
+        # would otherwise trigger its own layout pass and column re-scan.
+        self.rules_table.setUpdatesEnabled(False)
+        self.rules_table.blockSignals(True)
+        self.rules_table.setRowCount(len(rules))
+        for row_index, rule in enumerate(rules):
+            self._fill_rule_row(row_index, rule)
+        self.rules_table.blockSignals(False)
+        self.rules_table.setUpdatesEnabled(True)
+        self.rules_table.resizeColumnsToContents()
+        self.rules_table.viewport().update()
         self._refresh_default_rules_button_state()
         self._update_schedule_controls_visibility(self.schedule_enabled_checkbox.isChecked())
         self._refresh_dialog_size()
@@ -725,15 +1048,11 @@ class SettingsDialog(QDialog):
     def _handle_schedule_enabled_toggled(self, checked: bool) -> None:
         self._update_schedule_controls_visibility(checked)
         self._refresh_dialog_size()
-        QTimer.singleShot(0, self._refresh_dialog_size)
 
     def _update_schedule_controls_visibility(self, schedule_enabled: bool) -> None:
-        dim_opacity = 1.0 if schedule_enabled else 0.5
-        self.gradual_checkbox.setVisible(True)
-        self.location_status_widget.setVisible(True)
-        self.rules_header_label.setVisible(True)
-        self.rules_table.setVisible(True)
-        self.rule_buttons_widget.setVisible(True)
+        # Native disabled-state dimming: QGraphicsOpacityEffect forced each
+        # subtree through an offscreen render and alpha composite on every
+        # paint.
         for widget in (
             self.gradual_checkbox,
             self.location_status_widget,
@@ -741,53 +1060,89 @@ class SettingsDialog(QDialog):
             self.rules_table,
             self.rule_buttons_widget,
         ):
-            self._set_widget_opacity(widget, dim_opacity)
+            widget.setEnabled(schedule_enabled)
 
-    @staticmethod
-    def _set_widget_opacity(widget: QWidget, opacity: float) -> None:
-        effect = widget.graphicsEffect()
-        if not isinstance(effect, QGraphicsOpacityEffect):
-            effect = QGraphicsOpacityEffect(widget)
-            widget.setGraphicsEffect(effect)
-        effect.setOpacity(max(0.0, min(1.0, opacity)))
+    def _schedule_next_clock_tick(self) -> None:
+        self._clock_timer.start((60 - datetime.now().second) * 1000 + 50)
+
+    def _handle_clock_tick(self) -> None:
+        self._update_location_time_label()
+        self._schedule_next_clock_tick()
 
     def _refresh_auto_location(self, refresh_detection: bool) -> None:
         if refresh_detection:
-            context = detect_location_context_from_ip()
-            if context is not None:
-                self._detected_location = context
-                self._location_timezone_name = context.timezone_name
-                self._source_config.schedule.latitude = context.latitude
-                self._source_config.schedule.longitude = context.longitude
-                self._sun_times_cache_key = None
+            self._start_location_detection()
 
         if not self._location_timezone_name:
             try:
+                from tzlocal import get_localzone_name
+
                 self._location_timezone_name = get_localzone_name()
             except Exception:
                 self._location_timezone_name = None
         self._update_location_time_label()
 
-    def _update_location_time_label(self) -> None:
-        timezone_name = self._location_timezone_name
-        timezone_label = ""
+    def _start_location_detection(self) -> None:
+        # The lookup can block on the network, so it runs on the global
+        # thread pool and the labels fill in when the result arrives.
+        if self._location_fetch_inflight:
+            return
+        self._location_fetch_inflight = True
+        worker = _LocationContextWorker()
+        worker.signals.finished.connect(self._handle_location_context)
+        QThreadPool.globalInstance().start(worker)
+
+    def _handle_location_context(self, context: object) -> None:
+        self._location_fetch_inflight = False
+        if not isinstance(context, LocationContext):
+            return
+        self._detected_location = context
+        self._location_timezone_name = context.timezone_name
+        self._source_config.schedule.latitude = context.latitude
+        self._source_config.schedule.longitude = context.longitude
+        self._sun_times_cache_key = None
+        self._update_location_time_label()
+        self._refresh_dialog_size()
+
+    def _resolve_location_timezone(self, timezone_name: str | None) -> ZoneInfo | None:
+        # ZoneInfo() re-reads the tzdata files each time; the detected name
+        # only changes when a new location lookup lands, so the object is
+        # built once and reused by every clock tick in between.
+        cached_name, cached_zone = self._cached_zoneinfo
+        if timezone_name == cached_name:
+            return cached_zone
+        zone: ZoneInfo | None = None
         if timezone_name:
             try:
-                current_time = datetime.now(ZoneInfo(timezone_name))
-                timezone_label = current_time.strftime("%Z").strip()
+                zone = ZoneInfo(timezone_name)
             except Exception:
-                current_time = datetime.now().astimezone()
+                zone = None
+        self._cached_zoneinfo = (timezone_name, zone)
+        return zone
+
+    def _update_location_time_label(self) -> None:
+        timezone_name = self._location_timezone_name
+        timezone = self._resolve_location_timezone(timezone_name)
+        if timezone is not None:
+            current_time = datetime.now(timezone)
         else:
             current_time = datetime.now().astimezone()
-        if not timezone_label:
-            timezone_label = (current_time.astimezone().tzname() or "").strip()
+        # Both branches produce an aware datetime, so tzname() answers
+        # directly; the old fallback re-ran astimezone() against the local
+        # time database just to ask for the same abbreviation.
+        timezone_label = (current_time.tzname() or "").strip()
         time_text = current_time.strftime("%H:%M")
         if timezone_label:
             time_text = f"{time_text} {timezone_label}"
         self.location_time_label.setText(time_text)
-        self._update_sun_event_labels(current_time, timezone_name)
+        self._update_sun_event_labels(current_time, timezone_name, timezone)
 
-    def _update_sun_event_labels(self, current_time: datetime, timezone_name: str | None) -> None:
+    def _update_sun_event_labels(
+        self,
+        current_time: datetime,
+        timezone_name: str | None,
+        timezone: ZoneInfo | None = None,
+    ) -> None:
         latitude = self._source_config.schedule.latitude
         longitude = self._source_config.schedule.longitude
         if latitude is None or longitude is None:
@@ -796,61 +1151,96 @@ class SettingsDialog(QDialog):
             self._sun_times_cache_key = None
             return
 
-        if timezone_name:
-            try:
-                timezone = ZoneInfo(timezone_name)
-            except Exception:
-                timezone = current_time.astimezone().tzinfo
+        # Build the cache key before touching astral: on the 1 Hz clock
+        # tick the key matches and this returns without any solar math.
+        # The caller hands over its already-resolved ZoneInfo, so a miss
+        # needs no timezone construction either.
+        if timezone is not None and timezone_name:
+            timezone_key = timezone_name
         else:
             timezone = current_time.astimezone().tzinfo
-        if timezone is None:
-            self.sunrise_time_label.setText("Sunrise --:--")
-            self.sunset_time_label.setText("Sunset --:--")
-            self._sun_times_cache_key = None
-            return
-
-        timezone_key = timezone_name or str(timezone)
+            if timezone is None:
+                self.sunrise_time_label.setText("Sunrise --:--")
+                self.sunset_time_label.setText("Sunset --:--")
+                self._sun_times_cache_key = None
+                return
+            timezone_key = str(timezone)
+        # All-int key fields (coordinates quantized to 1e-5 degrees) keep
+        # the per-tick comparison allocation-free.
         cache_key = (
-            current_time.date().isoformat(),
-            round(float(latitude), 5),
-            round(float(longitude), 5),
+            current_time.date().toordinal(),
+            int(float(latitude) * 100000),
+            int(float(longitude) * 100000),
             timezone_key,
         )
         if self._sun_times_cache_key == cache_key:
             return
 
+        memoized = self._sun_times_memo.get(cache_key)
+        if memoized is not None:
+            self._sun_times_memo.move_to_end(cache_key)
+            sunrise_text, sunset_text = memoized
+            self.sunrise_time_label.setText(f"Sunrise {sunrise_text}")
+            self.sunset_time_label.setText(f"Sunset {sunset_text}")
+            self._sun_times_cache_key = cache_key
+            return
+
         try:
-            location = LocationInfo(
-                name="Local",
-                region="Local",
-                timezone=timezone_key,
-                latitude=float(latitude),
-                longitude=float(longitude),
+            # Deferred: pulls astral in via the schedule engine, and only on
+            # a cache miss with a known location.  Reusing the engine's
+            # memoized solver means one solar computation per (day,
+            # location) serves both these labels and the scheduler, and the
+            # two can never disagree.
+            from .sun_schedule import _compute_sun_events
+
+            events = _compute_sun_events(
+                cache_key[0],
+                round(float(latitude), 4),
+                round(float(longitude), 4),
+                timezone_key,
             )
-            sun_times = sun(location.observer, date=current_time.date(), tzinfo=timezone)
-            sunrise_time = sun_times.get("sunrise")
-            sunset_time = sun_times.get("sunset")
         except Exception:
-            sunrise_time = None
-            sunset_time = None
+            events = None
 
-        sunrise_text = sunrise_time.strftime("%H:%M") if sunrise_time is not None else "--:--"
-        sunset_text = sunset_time.strftime("%H:%M") if sunset_time is not None else "--:--"
+        if events is not None:
+            sunrise_text = datetime.fromtimestamp(events[0], timezone).strftime("%H:%M")
+            sunset_text = datetime.fromtimestamp(events[1], timezone).strftime("%H:%M")
+        else:
+            sunrise_text = "--:--"
+            sunset_text = "--:--"
         self.sunrise_time_label.setText(f"Sunrise {sunrise_text}")
         self.sunset_time_label.setText(f"Sunset {sunset_text}")
+        self._sun_times_memo[cache_key] = (sunrise_text, sunset_text)
+        if len(self._sun_times_memo) > 8:
+            self._sun_times_memo.popitem(last=False)
         self._sun_times_cache_key = cache_key
 
     def showEvent(self, event) -> None:  # type: ignore[override]
         super().showEvent(event)
         _apply_native_rounded_corners(self)
+        window_handle = self.windowHandle()
+        if window_handle is not None and not self._screen_signal_connected:
+            window_handle.screenChanged.connect(self._handle_screen_changed)
+            self._screen_signal_connected = True
         self._refresh_auto_location(refresh_detection=True)
+        self._schedule_next_clock_tick()
         self._position_bottom_right()
-        QTimer.singleShot(0, self._refresh_dialog_size)
+        self._refresh_dialog_size()
+
+    def hideEvent(self, event) -> None:  # type: ignore[override]
+        self._clock_timer.stop()
+        super().hideEvent(event)
+
+    def changeEvent(self, event) -> None:  # type: ignore[override]
+        if event.type() == QEvent.Type.StyleChange:
+            self._scrollbar_extent = self.style().pixelMetric(
+                QStyle.PixelMetric.PM_ScrollBarExtent
+            )
+        super().changeEvent(event)
 
     def _rules_table_content_height(self) -> int:
-        self.rules_table.resizeRowsToContents()
         header_height = self.rules_table.horizontalHeader().height()
-        row_heights = sum(self.rules_table.rowHeight(index) for index in range(self.rules_table.rowCount()))
+        row_heights = self.rules_table.rowCount() * self._rules_row_height
         frame_height = self.rules_table.frameWidth() * 2
         return header_height + row_heights + frame_height + 2
 
@@ -861,6 +1251,11 @@ class SettingsDialog(QDialog):
         return max(360, available.height() - 12)
 
     def _available_geometry(self):
+        # Same caching as PictureControlsDialog: the work-area rect is only
+        # re-resolved after the dialog moves to a different screen or the
+        # screen's own geometry shifts.
+        if self._available_geometry_cache is not None:
+            return self._available_geometry_cache
         screen = self.screen()
         if screen is None and self.parentWidget() is not None:
             screen = self.parentWidget().screen()
@@ -868,7 +1263,27 @@ class SettingsDialog(QDialog):
             screen = QGuiApplication.primaryScreen()
         if screen is None:
             return None
-        return screen.availableGeometry()
+        self._available_geometry_cache = screen.availableGeometry()
+        self._track_screen_geometry(screen)
+        return self._available_geometry_cache
+
+    def _track_screen_geometry(self, screen) -> None:
+        # Same reconnection dance as PictureControlsDialog: follow the
+        # resolved screen's work-area signal so resolution and taskbar
+        # changes invalidate the cache mid-session.
+        if screen is self._geometry_signal_screen:
+            return
+        previous = self._geometry_signal_screen
+        if previous is not None:
+            try:
+                previous.availableGeometryChanged.disconnect(self._handle_screen_changed)
+            except (RuntimeError, TypeError):
+                pass
+        screen.availableGeometryChanged.connect(self._handle_screen_changed)
+        self._geometry_signal_screen = screen
+
+    def _handle_screen_changed(self, _screen=None) -> None:
+        self._available_geometry_cache = None
 
     def _clamp_to_available_geometry(self) -> None:
         available = self._available_geometry()
@@ -893,6 +1308,13 @@ class SettingsDialog(QDialog):
         self.move(_bottom_right_popup_position(self, available))
 
     def _refresh_dialog_size(self) -> None:
+        # Pre-show calls are wasted work: showEvent schedules one relayout
+        # once the dialog is mapped.
+        if self._bulk_add_in_progress or not self.isVisible():
+            return
+        self._refresh_size_timer.start()
+
+    def _refresh_dialog_size_now(self) -> None:
         table_height = self._rules_table_content_height()
         self.rules_table.setFixedHeight(table_height)
         self.rules_table.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
@@ -921,44 +1343,56 @@ class SettingsDialog(QDialog):
         self.content_scroll.setFixedHeight(content_height)
         target_width = max(self.minimumWidth(), content_size.width() + margins.left() + margins.right())
         if needs_scroll:
-            scrollbar_width = self.style().pixelMetric(QStyle.PixelMetric.PM_ScrollBarExtent)
-            target_width += max(0, scrollbar_width)
+            target_width += max(0, self._scrollbar_extent)
 
         self.content_scroll.setVerticalScrollBarPolicy(
             Qt.ScrollBarPolicy.ScrollBarAlwaysOff
             if preferred_height <= max_height
             else Qt.ScrollBarPolicy.ScrollBarAsNeeded
         )
-        self.resize(target_width, target_height)
+        # Same single-setGeometry fusion as PictureControlsDialog.
         if self.isVisible():
-            self._position_bottom_right()
+            available = self._available_geometry()
+            if available is not None:
+                target = _bottom_right_popup_position(
+                    self, available, QSize(target_width, target_height)
+                )
+                self.setGeometry(target.x(), target.y(), target_width, target_height)
+                return
+        self.resize(target_width, target_height)
 
     def _add_empty_rule(self) -> None:
         self._add_rule_row(ScheduleRule(anchor="sunrise", offset_minutes=0, brightness=100, target="both"))
         self._refresh_dialog_size()
 
     @staticmethod
-    def _default_sunrise_sunset_ramp_rules() -> list[ScheduleRule]:
-        return [
-            ScheduleRule(anchor="sunrise", offset_minutes=0, brightness=0, target="both"),
-            ScheduleRule(anchor="sunrise", offset_minutes=15, brightness=10, target="both"),
-            ScheduleRule(anchor="sunrise", offset_minutes=40, brightness=50, target="both"),
-            ScheduleRule(anchor="sunrise", offset_minutes=60, brightness=100, target="both"),
-            ScheduleRule(anchor="sunset", offset_minutes=-40, brightness=100, target="both"),
-            ScheduleRule(anchor="sunset", offset_minutes=-15, brightness=50, target="both"),
-            ScheduleRule(anchor="sunset", offset_minutes=0, brightness=15, target="both"),
-            ScheduleRule(anchor="sunset", offset_minutes=30, brightness=0, target="both"),
-        ]
+    def _default_sunrise_sunset_ramp_rules() -> tuple[ScheduleRule, ...]:
+        # The templates are never mutated after construction; every caller
+        # only reads field values into fresh widgets or tuples.
+        return _DEFAULT_SUN_RAMP_RULES
 
     def _apply_default_sunrise_sunset_rules(self) -> None:
-        for rule in self._default_sunrise_sunset_ramp_rules():
-            self._add_rule_row(rule)
+        # Suspend per-row refreshes for the bulk insert: eight rows go in,
+        # then one column resize, one button-state scan and one size pass.
+        self._bulk_add_in_progress = True
+        self.rules_table.setUpdatesEnabled(False)
+        try:
+            for rule in self._default_sunrise_sunset_ramp_rules():
+                self._add_rule_row(rule)
+        finally:
+            self.rules_table.setUpdatesEnabled(True)
+            self._bulk_add_in_progress = False
+        self.rules_table.resizeColumnsToContents()
         self.schedule_enabled_checkbox.setChecked(True)
         self.gradual_checkbox.setChecked(True)
         self._refresh_default_rules_button_state()
         self._refresh_dialog_size()
 
-    def _rule_from_row(self, row_index: int) -> ScheduleRule | None:
+    def _read_row_widgets(
+        self, row_index: int
+    ) -> tuple[QComboBox, QComboBox, QLineEdit, QSpinBox, QSpinBox] | None:
+        # Single crossing of the Qt boundary per row: both the save path and
+        # the default-block scan consume rows through this helper.
         target_widget = self.rules_table.cellWidget(row_index, 0)
         anchor_widget = self.rules_table.cellWidget(row_index, 1)
         time_widget = self.rules_table.cellWidget(row_index, 2)
@@ -974,50 +1408,65 @@ class SettingsDialog(QDialog):
             return None
         if not isinstance(brightness_widget, QSpinBox):
             return None
+        return (target_widget, anchor_widget, time_widget, offset_widget, brightness_widget)
+
+    def _rule_tuple_from_row(self, row_index: int) -> tuple[str, str, int, int, str | None] | None:
+        widgets = self._read_row_widgets(row_index)
+        if widgets is None:
+            return None
+        target_widget, anchor_widget, time_widget, offset_widget, brightness_widget = widgets
 
         target = str(target_widget.currentData() or "").strip().lower()
         if target not in ("display1", "display2", "both"):
             target = "both"
 
         anchor_text = anchor_widget.currentText().strip().lower()
+        # sys.intern maps the freshly built strings back onto the canonical
+        # literals, so the tuple comparisons in the default-block scan
+        # resolve by identity.
         if anchor_text == "specific time":
-            return ScheduleRule(
-                anchor="time",
-                offset_minutes=0,
-                brightness=clamp_brightness(brightness_widget.value()),
-                target=target,
-                specific_time=self._normalize_time_text(time_widget.text()),
+            return (
+                sys.intern(target),
+                "time",
+                0,
+                clamp_brightness(brightness_widget.value()),
+                self._normalize_time_text(time_widget.text()),
             )
         if anchor_text in ("sunrise", "sunset"):
-            return ScheduleRule(
-                anchor=anchor_text,
-                offset_minutes=int(offset_widget.value()),
-                brightness=clamp_brightness(brightness_widget.value()),
-                target=target,
-                specific_time=None,
+            return (
+                sys.intern(target),
+                sys.intern(anchor_text),
+                int(offset_widget.value()),
+                clamp_brightness(brightness_widget.value()),
+                None,
             )
         return None
 
-    def _rules_match_exact_slice(self, start_index: int, expected_rules: list[ScheduleRule]) -> bool:
-        for offset, expected_rule in enumerate(expected_rules):
-            actual_rule = self._rule_from_row(start_index + offset)
-            if actual_rule is None or actual_rule != expected_rule:
-                return False
-        return True
-
     def _has_untouched_default_sunrise_sunset_block(self) -> bool:
-        expected_rules = self._default_sunrise_sunset_ramp_rules()
-        expected_count = len(expected_rules)
+        expected = _DEFAULT_SUN_RAMP_TUPLES
+        expected_count = len(expected)
         row_count = self.rules_table.rowCount()
         if row_count < expected_count:
             return False
 
-        for start_index in range(0, row_count - expected_count + 1):
-            if self._rules_match_exact_slice(start_index, expected_rules):
-                return True
-        return False
+        # One pass of widget reads per row; the sliding comparison below is
+        # then pure tuple equality with no further Qt traffic, instead of
+        # re-reading every cell for each candidate start position.
+        rows = [self._rule_tuple_from_row(index) for index in range(row_count)]
+        return any(
+            tuple(rows[start : start + expected_count]) == expected
+            for start in range(row_count - expected_count + 1)
+        )
 
     def _refresh_default_rules_button_state(self) -> None:
+        # Editing one rule cell fires several change signals back to back;
+        # the zero-delay single shot folds the burst into one table scan per
+        # event-loop pass.
+        if self._bulk_add_in_progress:
+            return
+        self._default_rules_state_timer.start()
+
+    def _refresh_default_rules_button_state_now(self) -> None:
         has_untouched_default_block = self._has_untouched_default_sunrise_sunset_block()
         self.load_default_sun_rules_button.setVisible(not has_untouched_default_block)
         self.load_default_sun_rules_button.setText("Add Default Sunrise/Sunset Rules to List")
@@ -1028,14 +1477,19 @@ class SettingsDialog(QDialog):
     def _add_rule_row(self, rule: ScheduleRule) -> None:
         row_index = self.rules_table.rowCount()
         self.rules_table.insertRow(row_index)
+        self._fill_rule_row(row_index, rule)
+        if self._bulk_add_in_progress:
+            return
+        self.rules_table.resizeColumnsToContents()
+        self._refresh_default_rules_button_state()
 
+    def _fill_rule_row(self, row_index: int, rule: ScheduleRule) -> None:
         target_combo = QComboBox()
-        for value, label in self._build_target_choices():
-            target_combo.addItem(label, userData=value)
+        target_combo.setModel(self._target_model)
         target_combo.setCurrentIndex(max(0, target_combo.findData(rule.target)))
 
         anchor_combo = QComboBox()
-        anchor_combo.addItems(["sunrise", "sunset", "specific time"])
+        anchor_combo.setModel(self._anchor_model)
         if rule.anchor == "time":
             anchor_combo.setCurrentText("specific time")
         else:
@@ -1043,8 +1497,7 @@ class SettingsDialog(QDialog):
 
         time_edit = QLineEdit()
         time_edit.setPlaceholderText("HH:MM")
-        time_regex = QRegularExpression(r"^([01]?\d|2[0-3]):[0-5]\d$")
-        time_edit.setValidator(QRegularExpressionValidator(time_regex, self))
+        time_edit.setValidator(self._hhmm_validator)
         if rule.specific_time:
             time_edit.setText(rule.specific_time)
 
@@ -1065,18 +1518,16 @@ class SettingsDialog(QDialog):
         anchor_combo.currentTextChanged.connect(
             lambda _text: self._sync_rule_anchor_mode(anchor_combo, time_edit, offset_spin)
         )
-        target_combo.currentIndexChanged.connect(
-            lambda _index: self._refresh_default_rules_button_state()
-        )
-        anchor_combo.currentIndexChanged.connect(
-            lambda _index: self._refresh_default_rules_button_state()
-        )
-        time_edit.textChanged.connect(lambda _text: self._refresh_default_rules_button_state())
-        offset_spin.valueChanged.connect(lambda _value: self._refresh_default_rules_button_state())
-        brightness_spin.valueChanged.connect(
-            lambda _value: self._refresh_default_rules_button_state()
-        )
+        # One shared slot instead of five per-row lambda closures; the
+        # debounced refresh does not care which cell changed.
+        target_combo.currentIndexChanged.connect(self._handle_rule_cell_changed)
+        anchor_combo.currentIndexChanged.connect(self._handle_rule_cell_changed)
+        time_edit.textChanged.connect(self._handle_rule_cell_changed)
+        offset_spin.valueChanged.connect(self._handle_rule_cell_changed)
+        brightness_spin.valueChanged.connect(self._handle_rule_cell_changed)
         self._sync_rule_anchor_mode(anchor_combo, time_edit, offset_spin)
+
+    def _handle_rule_cell_changed(self, _value=None) -> None:
         self._refresh_default_rules_button_state()
 
     def _sync_rule_anchor_mode(
@@ -1122,52 +1573,19 @@ class SettingsDialog(QDialog):
     def _collect_rules(self) -> tuple[list[ScheduleRule], str | None]:
         rules: list[ScheduleRule] = []
         for row_index in range(self.rules_table.rowCount()):
-            target_widget = self.rules_table.cellWidget(row_index, 0)
-            anchor_widget = self.rules_table.cellWidget(row_index, 1)
-            time_widget = self.rules_table.cellWidget(row_index, 2)
-            offset_widget = self.rules_table.cellWidget(row_index, 3)
-            brightness_widget = self.rules_table.cellWidget(row_index, 4)
-            if not isinstance(target_widget, QComboBox):
-                continue
-            if not isinstance(anchor_widget, QComboBox):
-                continue
-            if not isinstance(time_widget, QLineEdit):
+            values = self._rule_tuple_from_row(row_index)
+            if values is None:
                 continue
-            if not isinstance(offset_widget, QSpinBox):
-                continue
-            if not isinstance(brightness_widget, QSpinBox):
-                continue
-
-            target = str(target_widget.currentData() or "").strip().lower()
-            if target not in ("display1", "display2", "both"):
-                target = "both"
-
-            anchor_text = anchor_widget.currentText().strip().lower()
-            if anchor_text == "specific time":
-                specific_time = self._normalize_time_text(time_widget.text())
-                if specific_time is None:
-                    return ([], f"Rule {row_index + 1}: specific time must be HH:MM (24-hour).")
-                rules.append(
-                    ScheduleRule(
-                        anchor="time",
-                        offset_minutes=0,
-                        brightness=clamp_brightness(brightness_widget.value()),
-                        target=target,
-                        specific_time=specific_time,
-                    )
-                )
-                continue
-
-            if anchor_text not in ("sunrise", "sunset"):
-                continue
-
+            target, anchor, offset_minutes, brightness, specific_time = values
+            if anchor == "time" and specific_time is None:
+                return ([], f"Rule {row_index + 1}: specific time must be HH:MM (24-hour).")
             rules.append(
                 ScheduleRule(
-                    anchor=anchor_text,
-                    offset_minutes=int(offset_widget.value()),
-                    brightness=clamp_brightness(brightness_widget.value()),
+                    anchor=anchor,
+                    offset_minutes=offset_minutes,
+                    brightness=brightness,
                     target=target,
-                    specific_time=None,
+                    specific_time=specific_time,
                 )
             )
         return (rules, None)
@@ -1187,16 +1605,29 @@ class SettingsDialog(QDialog):
             )
             return
 
-        updated = deepcopy(self._source_config)
-        updated.theme = self._selected_theme
-        updated.startup_enabled = self.startup_checkbox.isChecked()
-        updated.schedule.enabled = self.schedule_enabled_checkbox.isChecked()
-        updated.schedule.gradual = self.gradual_checkbox.isChecked()
-        updated.schedule.auto_location = True
+        # Every field the save touches is rebuilt here, so a targeted
+        # replace() is enough; deepcopy walked the whole config tree only to
+        # have most of the copies overwritten.
+        schedule = self._source_config.schedule
+        latitude = schedule.latitude
+        longitude = schedule.longitude
         if self._detected_location is not None:
-            updated.schedule.latitude = self._detected_location.latitude
-            updated.schedule.longitude = self._detected_location.longitude
-        updated.schedule.rules = rules or default_schedule_rules()
+            latitude = self._detected_location.latitude
+            longitude = self._detected_location.longitude
+        updated = dataclass_replace(
+            self._source_config,
+            theme=self._selected_theme,
+            startup_enabled=self.startup_checkbox.isChecked(),
+            schedule=dataclass_replace(
+                schedule,
+                enabled=self.schedule_enabled_checkbox.isChecked(),
+                gradual=self.gradual_checkbox.isChecked(),
+                auto_location=True,
+                latitude=latitude,
+                longitude=longitude,
+                rules=rules or default_schedule_rules(),
+            ),
+        )
 
         self.updated_config = updated
         self.accept()
@@ -1230,11 +1661,11 @@ class SettingsDialog(QDialog):
 
 class BrightnessControlWindow(QWidget):
     settings_changed = Signal(object)
+    monitors_loaded = Signal()
     _AMBIENT_TIMER_INTERVAL_MS = 1_100
     _AMBIENT_APPLY_DEADBAND = 2
     _AMBIENT_MAX_STEP = 4
     _AMBIENT_SMOOTHING_ALPHA = 0.24
-    _AMBIENT_PERSIST_INTERVAL_SEC = 5.0
 
     def __init__(
         self,
@@ -1255,15 +1686,33 @@ class BrightnessControlWindow(QWidget):
         _apply_rounded_popup_chrome(self, "brightnessControlPopup")
 
         self._internal_ui_update = False
+        self._icon_cache: dict[tuple[str, str, float], QIcon] = {}
         self.monitor_rows: list[MonitorSliderRow] = []
+        # Kept in lockstep with monitor_rows for O(1) lookup on the slider
+        # hot path.
+        self._rows_by_key: dict[str, MonitorSliderRow] = {}
+        # Running total of the row slider values, so the global-average sync
+        # is a division instead of one Qt property read per row per event.
+        self._row_levels: dict[str, int] = {}
+        self._brightness_sum = 0
+        # All monitor rows share one height; measured lazily from the first
+        # row and dropped when the rows or the theme change.
+        self._row_height_cache: int | None = None
         self._schedule_status_text = "Schedule: off"
         self._popup_anchor_point: QPoint | None = None
         self._ambient_service = AmbientLightService()
         self._ambient_smoothed_target: float | None = None
         self._last_ambient_applied: int | None = None
-        self._last_ambient_persist_ts = 0.0
         self._last_popup_hide_monotonic = 0.0
 
+        # Slider drags and ambient ticks call _persist_config dozens of
+        # times a second; the single shot coalesces them so the serialize
+        # and atomic rewrite hit the disk at most every 400 ms.
+        self._persist_timer = QTimer(self)
+        self._persist_timer.setSingleShot(True)
+        self._persist_timer.setInterval(400)
+        self._persist_timer.timeout.connect(self._persist_config_now)
+
         root_layout = QVBoxLayout(self)
         root_layout.setContentsMargins(10, 10, 10, 10)
 
@@ -1340,10 +1789,24 @@ class BrightnessControlWindow(QWidget):
         self._internal_ui_update = False
         self._update_link_mode_ui()
         self._refresh_toolbar_icons()
-        self.refresh_monitors(apply_saved=True)
+        # The DDC/CI enumeration takes tens of milliseconds per monitor, so
+        # it runs on the first event-loop pass instead of blocking window
+        # construction.  It cannot wait for the first popup: the scheduler
+        # applies targets through monitor_rows right after startup.
+        self._monitors_loaded = False
+        QTimer.singleShot(0, self._initial_monitor_load)
         self._set_ambient_enabled(self.config.ambient_auto_enabled, persist=False)
 
+    def _initial_monitor_load(self) -> None:
+        if not self._monitors_loaded:
+            self.refresh_monitors(apply_saved=True)
+        # Emitted exactly once, on the first event-loop pass, so the
+        # controller's forced startup evaluation sees populated monitor_rows.
+        self.monitors_loaded.emit()
+
     def show_as_popup(self, anchor_point: QPoint) -> None:
+        if not self._monitors_loaded:
+            self.refresh_monitors(apply_saved=True)
         self._popup_anchor_point = QPoint(anchor_point)
         self._apply_popup_geometry(anchor_point)
         self.show()
@@ -1415,6 +1878,7 @@ class BrightnessControlWindow(QWidget):
         self.move(target_x, target_y)
 
     def refresh_monitors(self, apply_saved: bool) -> None:
+        self._monitors_loaded = True
         try:
             monitors = self.service.refresh_monitors()
         except Exception as error:
@@ -1433,9 +1897,10 @@ class BrightnessControlWindow(QWidget):
             return
 
         self.info_label.setText(f"Detected {len(monitors)} display(s).")
+        current_levels = self.service.get_brightness_all()
         for monitor in monitors:
             saved_level = self.config.monitor_levels.get(monitor.key)
-            current_level = self.service.get_brightness(monitor)
+            current_level = current_levels.get(monitor.key)
             if apply_saved:
                 initial_level = saved_level if saved_level is not None else (
                     current_level if current_level is not None else self.config.last_global_brightness
@@ -1448,8 +1913,10 @@ class BrightnessControlWindow(QWidget):
             row = MonitorSliderRow(monitor, initial_level)
             row.brightness_changed.connect(self._handle_monitor_slider_change)
             self.monitor_rows.append(row)
+            self._rows_by_key[monitor.key] = row
             self.monitor_rows_layout.addWidget(row)
 
+        self._recompute_brightness_sum()
         self._update_link_mode_ui()
         self._sync_monitor_scroll_height()
         self._refresh_visible_popup_geometry()
@@ -1475,32 +1942,63 @@ class BrightnessControlWindow(QWidget):
             level = self.config.monitor_levels.get(row.monitor.key)
             if level is None:
                 continue
-            self.service.set_brightness(row.monitor, level)
-            row.set_value(level)
+            bounded = clamp_brightness(level)
+            self.service.set_brightness(row.monitor, bounded)
+            row.set_value(bounded)
+            self._note_row_level(row.monitor.key, bounded)
         self._sync_global_slider_to_average()
 
+    def _apply_row_level(
+        self, row: MonitorSliderRow, level: int, *, update_config: bool = True
+    ) -> bool:
+        """Apply one level to one row: clamp, DDC write, slider, bookkeeping.
+
+        Rows already at the target are skipped entirely, so a no-op call
+        costs a dict lookup and issues no hardware write.  Returns whether
+        anything changed.
+        """
+        bounded = clamp_brightness(level)
+        key = row.monitor.key
+        if self._row_levels.get(key) == bounded:
+            return False
+        # Debounced: during a drag only the value the slider rests on
+        # reaches the DDC bus, and the write runs off the GUI thread.
+        self.service.set_brightness_debounced(row.monitor, bounded)
+        row.set_value(bounded)
+        self._note_row_level(key, bounded)
+        if update_config:
+            self.config.monitor_levels[key] = bounded
+        return True
+
     def apply_brightness_to_all(self, value: int, persist: bool = True) -> None:
         bounded = clamp_brightness(value)
+        # No-op drags and redundant link-mode applies bail out before the
+        # row loop.  The sum comparison is the cheap gate; the all() sweep
+        # over the tracked levels (plain dict reads, no Qt) confirms it,
+        # since equal sums alone do not imply equal rows.
+        if (
+            self.monitor_rows
+            and self._brightness_sum == bounded * len(self.monitor_rows)
+            and all(level == bounded for level in self._row_levels.values())
+        ):
+            self._set_global_slider_value(bounded)
+            return
         for row in self.monitor_rows:
-            self.service.set_brightness(row.monitor, bounded)
-            row.set_value(bounded)
+            self._apply_row_level(row, bounded, update_config=persist)
 
         self._set_global_slider_value(bounded)
         if persist:
             self.config.last_global_brightness = bounded
-            for row in self.monitor_rows:
-                self.config.monitor_levels[row.monitor.key] = bounded
             self._persist_config()
 
     def apply_brightness_map(self, values: dict[str, int], persist: bool = True) -> None:
         applied: list[int] = []
-        for row in self.monitor_rows:
-            if row.monitor.key not in values:
+        for key, raw_level in values.items():
+            row = self._rows_by_key.get(key)
+            if row is None:
                 continue
-            level = clamp_brightness(values[row.monitor.key])
-            self.service.set_brightness(row.monitor, level)
-            row.set_value(level)
-            self.config.monitor_levels[row.monitor.key] = level
+            level = clamp_brightness(raw_level)
+            self._apply_row_level(row, level)
             applied.append(level)
 
         if not applied:
@@ -1535,12 +2033,33 @@ class BrightnessControlWindow(QWidget):
             self._persist_config()
 
     def _load_refresh_icon(self) -> QIcon:
+        # Icons only vary by theme; repaints after settings-dialog closes
+        # are dict hits instead of pixmap allocation and painter passes.
+        theme = normalize_theme_name(self.config.theme)
+        key = (theme, "refresh", self.devicePixelRatioF())
+        icon = self._icon_cache.get(key)
+        if icon is None:
+            icon = self._paint_refresh_icon(theme)
+            self._icon_cache[key] = icon
+        return icon
+
+    def _build_settings_icon(self) -> QIcon:
+        theme = normalize_theme_name(self.config.theme)
+        key = (theme, "settings", self.devicePixelRatioF())
+        icon = self._icon_cache.get(key)
+        if icon is None:
+            icon = self._paint_settings_icon(theme)
+            self._icon_cache[key] = icon
+        return icon
+
+    def _paint_refresh_icon(self, theme: str) -> QIcon:
         if REFRESH_ICON_PATH is not None:
             source = QPixmap(str(REFRESH_ICON_PATH))
             if source.isNull():
                 return QIcon(str(REFRESH_ICON_PATH))
-            if normalize_theme_name(self.config.theme) == THEME_DARK:
+            if theme == THEME_DARK:
                 tinted = QPixmap(source.size())
+                tinted.setDevicePixelRatio(source.devicePixelRatio())
                 tinted.fill(Qt.GlobalColor.transparent)
                 painter = QPainter(tinted)
                 painter.drawPixmap(0, 0, source)
@@ -1551,13 +2070,14 @@ class BrightnessControlWindow(QWidget):
             return QIcon(source)
         return self.style().standardIcon(QStyle.StandardPixmap.SP_BrowserReload)
 
-    def _build_settings_icon(self) -> QIcon:
+    def _paint_settings_icon(self, theme: str) -> QIcon:
         if SETTINGS_ICON_PATH is not None:
             source = QPixmap(str(SETTINGS_ICON_PATH))
             if source.isNull():
                 return QIcon(str(SETTINGS_ICON_PATH))
-            if normalize_theme_name(self.config.theme) == THEME_DARK:
+            if theme == THEME_DARK:
                 tinted = QPixmap(source.size())
+                tinted.setDevicePixelRatio(source.devicePixelRatio())
                 tinted.fill(Qt.GlobalColor.transparent)
                 painter = QPainter(tinted)
                 painter.drawPixmap(0, 0, source)
@@ -1567,11 +2087,17 @@ class BrightnessControlWindow(QWidget):
                 return QIcon(tinted)
             return QIcon(source)
 
-        size = 18
+        # Physical pixels scaled by the device pixel ratio keep the
+        # synthesized icon sharp on HiDPI screens; with the ratio set on
+        # the pixmap, the painter below still draws in 18x18 logical
+        # coordinates.
+        ratio = self.devicePixelRatioF()
+        size = max(1, round(18 * ratio))
         pixmap = QPixmap(size, size)
+        pixmap.setDevicePixelRatio(ratio)
         pixmap.fill(Qt.GlobalColor.transparent)
 
-        if normalize_theme_name(self.config.theme) == THEME_DARK:
+        if theme == THEME_DARK:
             bar_color = QColor(255, 255, 255)
         else:
             palette = self.palette()
@@ -1647,7 +2173,6 @@ class BrightnessControlWindow(QWidget):
             self.config.ambient_auto_enabled = True
             self._ambient_smoothed_target = None
             self._last_ambient_applied = None
-            self._last_ambient_persist_ts = 0.0
             self._ambient_service.start()
             self._ambient_timer.start()
             self._handle_ambient_timer_tick()
@@ -1657,11 +2182,14 @@ class BrightnessControlWindow(QWidget):
             self._ambient_service.stop()
             self._ambient_smoothed_target = None
             self._last_ambient_applied = None
-            self._last_ambient_persist_ts = 0.0
 
         self._update_link_mode_ui()
         if persist:
             self._persist_config()
+            if not target_enabled:
+                # Disabling auto light should land on disk immediately, not
+                # a debounce window later.
+                self.flush_pending_persist()
 
     def _handle_ambient_timer_tick(self) -> None:
         if not self.config.ambient_auto_enabled:
@@ -1669,6 +2197,8 @@ class BrightnessControlWindow(QWidget):
         if not self.monitor_rows:
             return
 
+        if self._ambient_service.needs_external_polling():
+            self._ambient_service.probe_sensor()
         lux = self._ambient_service.latest_lux()
         if lux is None:
             return
@@ -1697,12 +2227,8 @@ class BrightnessControlWindow(QWidget):
 
         applied_any = False
         for row in target_rows:
-            if row.slider.value() == next_level:
-                continue
-            self.service.set_brightness(row.monitor, next_level)
-            row.set_value(next_level)
-            self.config.monitor_levels[row.monitor.key] = next_level
-            applied_any = True
+            if self._apply_row_level(row, next_level):
+                applied_any = True
 
         if not applied_any and self._last_ambient_applied is not None:
             return
@@ -1714,13 +2240,9 @@ class BrightnessControlWindow(QWidget):
         else:
             self._sync_global_slider_to_average()
 
-        now_seconds = wall_time.monotonic()
-        if (
-            self._last_ambient_persist_ts <= 0.0
-            or now_seconds - self._last_ambient_persist_ts >= self._AMBIENT_PERSIST_INTERVAL_SEC
-        ):
-            self._persist_config()
-            self._last_ambient_persist_ts = now_seconds
+        # The debounce inside _persist_config already rate-limits disk
+        # writes, so the old manual persist-interval bookkeeping is gone.
+        self._persist_config()
 
     def _ambient_target_rows(self) -> list[MonitorSliderRow]:
         if not self.monitor_rows:
@@ -1736,13 +2258,12 @@ class BrightnessControlWindow(QWidget):
 
     @staticmethod
     def _map_lux_to_brightness(lux: float) -> int:
-        safe_lux = max(0.0, float(lux))
-        normalized = math.log10(safe_lux + 1.0) / math.log10(801.0)
-        normalized = max(0.0, min(1.0, normalized))
-        minimum_brightness = 6.0
-        maximum_brightness = 100.0
-        target = minimum_brightness + normalized * (maximum_brightness - minimum_brightness)
-        return clamp_brightness(target)
+        index = int(lux)
+        if index < 0:
+            index = 0
+        elif index > _LUX_TABLE_MAX:
+            index = _LUX_TABLE_MAX
+        return _LUX_TO_BRIGHTNESS[index]
 
     def _handle_monitor_slider_change(self, monitor_key: str, value: int) -> None:
         if self._internal_ui_update:
@@ -1752,21 +2273,33 @@ class BrightnessControlWindow(QWidget):
             self.apply_brightness_to_all(value, persist=True)
             return
 
-        target_row = next((row for row in self.monitor_rows if row.monitor.key == monitor_key), None)
+        target_row = self._rows_by_key.get(monitor_key)
         if target_row is None:
             return
 
-        self.service.set_brightness(target_row.monitor, value)
+        self.service.set_brightness_debounced(target_row.monitor, value)
+        self._note_row_level(monitor_key, value)
         self.config.monitor_levels[monitor_key] = clamp_brightness(value)
         self._sync_global_slider_to_average()
         self._persist_config()
 
+    def _recompute_brightness_sum(self) -> None:
+        self._row_levels = {row.monitor.key: row.slider.value() for row in self.monitor_rows}
+        self._brightness_sum = sum(self._row_levels.values())
+
+    def _note_row_level(self, monitor_key: str, level: int) -> None:
+        # Incremental maintenance of the running sum; callers pass the
+        # already-clamped value that the row slider now shows.
+        old_level = self._row_levels.get(monitor_key)
+        if old_level is None or level == old_level:
+            return
+        self._brightness_sum += level - old_level
+        self._row_levels[monitor_key] = level
+
     def _sync_global_slider_to_average(self) -> None:
         if not self.monitor_rows:
             return
-        average_level = round(
-            sum(row.slider.value() for row in self.monitor_rows) / len(self.monitor_rows)
-        )
+        average_level = round(self._brightness_sum / len(self.monitor_rows))
         self.config.last_global_brightness = clamp_brightness(average_level)
         self._set_global_slider_value(average_level)
 
@@ -1780,13 +2313,19 @@ class BrightnessControlWindow(QWidget):
     def _update_link_mode_ui(self) -> None:
         link_toggle_visible = len(self.monitor_rows) > 1
         linked = self._is_link_mode_effective()
-        self.link_button.setVisible(link_toggle_visible)
-        self.link_button.setText("Linked" if linked else "Unlinked")
-        self.combined_group.setVisible(linked)
-        self.monitors_group.setVisible(not linked)
-        for row in self.monitor_rows:
-            row.setVisible(not linked)
-        self._sync_monitor_scroll_height()
+        # Each setVisible invalidates layout; holding updates folds the
+        # whole flip into one layout and paint pass.
+        self.setUpdatesEnabled(False)
+        try:
+            self.link_button.setVisible(link_toggle_visible)
+            self.link_button.setText("Linked" if linked else "Unlinked")
+            self.combined_group.setVisible(linked)
+            self.monitors_group.setVisible(not linked)
+            for row in self.monitor_rows:
+                row.setVisible(not linked)
+            self._sync_monitor_scroll_height()
+        finally:
+            self.setUpdatesEnabled(True)
         if self.config.ambient_auto_enabled:
             if linked:
                 self.ambient_button.setToolTip("Auto Light controls all linked displays.")
@@ -1803,6 +2342,10 @@ class BrightnessControlWindow(QWidget):
             if widget is not None:
                 widget.deleteLater()
         self.monitor_rows = []
+        self._rows_by_key = {}
+        self._row_levels = {}
+        self._brightness_sum = 0
+        self._row_height_cache = None
         self._sync_monitor_scroll_height()
 
     def _sync_monitor_scroll_height(self) -> None:
@@ -1817,7 +2360,9 @@ class BrightnessControlWindow(QWidget):
         spacing = self.monitor_rows_layout.spacing()
         margins = self.monitor_rows_layout.contentsMargins()
         content_height = margins.top() + margins.bottom()
-        content_height += sum(row.sizeHint().height() for row in self.monitor_rows)
+        if self._row_height_cache is None:
+            self._row_height_cache = self.monitor_rows[0].sizeHint().height()
+        content_height += self._row_height_cache * len(self.monitor_rows)
         content_height += max(0, len(self.monitor_rows) - 1) * spacing
         content_height += self.monitor_scroll.frameWidth() * 2
         max_height = 420
@@ -1853,6 +2398,8 @@ class BrightnessControlWindow(QWidget):
             return
 
         self.config = dialog.updated_config
+        # Theme changes can move style metrics, so remeasure the row height.
+        self._row_height_cache = None
         self._refresh_toolbar_icons()
         self._set_global_slider_value(self.config.last_global_brightness)
         self.set_link_mode(
@@ -1863,12 +2410,22 @@ class BrightnessControlWindow(QWidget):
         self.settings_changed.emit(self.config)
 
     def _persist_config(self) -> None:
+        self._persist_timer.start()
+
+    def _persist_config_now(self) -> None:
         self.config_store.save(self.config)
 
+    def flush_pending_persist(self) -> None:
+        if self._persist_timer.isActive():
+            self._persist_timer.stop()
+            self._persist_config_now()
+
     def closeEvent(self, event) -> None:  # type: ignore[override]
+        self.flush_pending_persist()
         self.hide()
         event.accept()
 
     def hideEvent(self, event) -> None:  # type: ignore[override]
         self._last_popup_hide_monotonic = wall_time.monotonic()
+        self.flush_pending_persist()
         super().hideEvent(event)